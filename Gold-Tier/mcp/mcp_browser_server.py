@@ -7,12 +7,37 @@ Uses Playwright for web automation tasks.
 
 import os
 import json
+import itertools
+import time
+import asyncio
+import atexit
+import queue
 import logging
 from pathlib import Path
+from contextlib import contextmanager, asynccontextmanager
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+from mcp_common import LOG_FORMATTER, buffered_file_handler, load_json
 from typing import Dict, List, Optional, Any, Union
 
-class MCPBrowserServer:
+# Resets the page's current origin to the saved login session's storage before the page is pooled:
+# clears local and session storage, then restores the saved localStorage items for that origin
+RESET_STORAGE_JS = """
+(origins) => {
+    try {
+        const saved = origins.find(entry => entry.origin === location.origin);
+        localStorage.clear();
+        sessionStorage.clear();
+        for (const {name, value} of (saved ? saved.localStorage : [])) {
+            localStorage.setItem(name, value);
+        }
+    } catch (e) {}
+}
+"""
+
+class _BrowserServerBase:
+    """Config, logging, saved login session and screenshot naming shared by the sync and async servers."""
+
     def __init__(self, config_path: str = "mcp_browser_config.json"):
         """
         Initialize the MCP browser server.
@@ -23,14 +48,35 @@ class MCPBrowserServer:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.logger = self._setup_logger()
+
+        # One Playwright driver and browser for the server's lifetime, started on first use;
+        # each call gets its own short-lived context, with the login session from storage_state
+        self._playwright = None
+        self._browser = None
+        self.storage_state_path = Path(self.config.get("storage_state", f'{self.config["session_path"]}_state.json'))
+
+        # Screenshot files are numbered per run; the start time keeps runs apart
+        self._screenshot_prefix = f"screenshot_{int(time.time())}"
+        self._screenshot_counter = itertools.count()
+
         self.logger.info("MCP Browser Server initialized")
 
+    def _next_screenshot_path(self) -> str:
+        """File name for the next screenshot, unique within and across runs."""
+        return f"{self._screenshot_prefix}_{next(self._screenshot_counter)}.png"
+
+    def _saved_login_state(self) -> Dict[str, Any]:
+        """Login session saved by login(), parsed once per file version; empty if there is none."""
+        try:
+            return load_json(self.storage_state_path)
+        except FileNotFoundError:
+            return {}
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                return load_json(self.config_path)
             else:
                 # Create default config
                 default_config = {
@@ -45,7 +91,7 @@ class MCPBrowserServer:
                 self._save_config(default_config)
                 return default_config
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
+            self.logger.error("Error loading config: %s", e)
             raise
 
     def _save_config(self, config: Dict[str, Any]):
@@ -54,32 +100,115 @@ class MCPBrowserServer:
             with open(self.config_path, 'w') as f:
                 json.dump(config, f, indent=2)
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
 
     def _setup_logger(self):
         """Set up logging."""
         logger = logging.getLogger('MCPBrowserServer')
+
+        # Already set up by an earlier instance - don't open another log file
+        if logger.handlers:
+            return logger
+
         logger.setLevel(logging.INFO)
 
-        # Create handlers
-        file_handler = logging.FileHandler('mcp_browser_server.log')
+        # Create handlers; file writes are batched (see buffered_file_handler)
+        file_handler = buffered_file_handler('mcp_browser_server.log')
         file_handler.setLevel(logging.INFO)
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-
-        # Create formatter and add to handlers
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(LOG_FORMATTER)
 
         # Add handlers to logger
-        if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
 
         return logger
 
+class MCPBrowserServer(_BrowserServerBase):
+    def __init__(self, config_path: str = "mcp_browser_config.json"):
+        """
+        Initialize the MCP browser server.
+
+        Args:
+            config_path (str): Path to configuration file
+        """
+        super().__init__(config_path)
+
+        # Idle pages (each in its own context) kept warm for the next call
+        self._page_pool = queue.LifoQueue(maxsize=self.config.get("pool_size", 4))
+
+    @property
+    def browser(self):
+        """Browser shared by all calls, launched on first use."""
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(
+                headless=self.config["browser"]["headless"],
+                args=self.config["browser"]["args"]
+            )
+        return self._browser
+
+    def _acquire_page(self):
+        """Take an idle page from the pool, or open one in a new context with the saved login session."""
+        try:
+            return self._page_pool.get_nowait()
+        except queue.Empty:
+            storage_state = str(self.storage_state_path) if self.storage_state_path.exists() else None
+            return self.browser.new_context(storage_state=storage_state).new_page()
+
+    def _release_page(self, page):
+        """
+        Reset a page to the saved login session and return it to the pool, so one call's cookies
+        and storage don't leak into the next; close its context if the pool is full or the page is broken.
+        Storage is reset for the origin the page ends on; other origins visited during the call keep theirs.
+        """
+        try:
+            saved_state = self._saved_login_state()
+            page.evaluate(RESET_STORAGE_JS, saved_state.get("origins", []))
+            page.goto("about:blank")
+            page.context.clear_cookies()
+            if saved_state.get("cookies"):
+                page.context.add_cookies(saved_state["cookies"])
+            self._page_pool.put_nowait(page)
+        except Exception:
+            page.context.close()
+
+    def _drain_page_pool(self):
+        """Close every pooled page's context (e.g. after the login session changed)."""
+        while True:
+            try:
+                page = self._page_pool.get_nowait()
+            except queue.Empty:
+                return
+            page.context.close()
+
+    @contextmanager
+    def _page(self):
+        """Yield a pooled page for the duration of one call."""
+        page = self._acquire_page()
+        try:
+            yield page
+        finally:
+            self._release_page(page)
+
+    def close(self):
+        """Close the shared browser and stop Playwright."""
+        self._drain_page_pool()
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def navigate(self, url: str, wait_until: str = "networkidle") -> Dict[str, Any]:
         """
         Navigate to a URL.
@@ -92,81 +221,61 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status and page info
         """
         try:
-            self.logger.info(f"Navigating to: {url}")
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
+            self.logger.info("Navigating to: %s", url)
 
+            with self._page() as page:
                 page.goto(url, wait_until=wait_until)
-                page.wait_for_load_state()
 
-                # Get page information
+                # Get page information - serialize the DOM once
+                page_url = page.url
+                title = page.title()
+                content = page.content()
                 page_info = {
-                    "url": page.url,
-                    "title": page.title(),
-                    "content": page.content()[:1000] + "..." if len(page.content()) > 1000 else page.content(),
-                    "screenshot": self._take_screenshot(page)
+                    "url": page_url,
+                    "title": title,
+                    "content": content[:1000] + "..." if len(content) > 1000 else content
                 }
 
-                browser.close()
-
-                self.logger.info(f"Successfully navigated to {url}")
-                return {"success": True, "page": page_info}
+            self.logger.info("Successfully navigated to %s", url)
+            return {"success": True, "page": page_info}
 
         except Exception as e:
-            self.logger.error(f"Error navigating to {url}: {e}")
+            self.logger.error("Error navigating to %s: %s", url, e)
             return {"success": False, "error": str(e)}
 
-    def click_element(self, selector: str, url: Optional[str] = None) -> Dict[str, Any]:
+    def click_element(self, selector: str, url: Optional[str] = None,
+                      wait_after: Optional[str] = None) -> Dict[str, Any]:
         """
         Click on an element.
 
         Args:
             selector (str): CSS selector for the element
             url (Optional[str]): URL to navigate to first (optional)
+            wait_after (Optional[str]): "navigation" to wait for the page the click opens,
+                "network_idle" to wait for requests to settle, None to return right away
 
         Returns:
             Dict[str, Any]: Result with success status
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 if url:
-                    page.goto(url)
-
-                # Wait for element to be visible
-                page.wait_for_selector(selector)
-                element = page.locator(selector)
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
 
-                # Click the element
-                element.click()
-
-                # Wait a bit for any navigation
-                page.wait_for_timeout(1000)
-
-                browser.close()
+                # Click the element (waits for it to be visible and enabled)
+                if wait_after == "navigation":
+                    with page.expect_navigation(wait_until="domcontentloaded", timeout=self.config["timeout"]):
+                        page.click(selector, timeout=self.config["timeout"])
+                else:
+                    page.click(selector, timeout=self.config["timeout"])
+                    if wait_after == "network_idle":
+                        page.wait_for_load_state("networkidle", timeout=self.config["timeout"])
 
-                self.logger.info(f"Clicked element: {selector}")
-                return {"success": True, "action": "clicked", "selector": selector}
+            self.logger.info("Clicked element: %s", selector)
+            return {"success": True, "action": "clicked", "selector": selector}
 
         except Exception as e:
-            self.logger.error(f"Error clicking element {selector}: {e}")
+            self.logger.error("Error clicking element %s: %s", selector, e)
             return {"success": False, "error": str(e)}
 
     def fill_form(self, selector: str, text: str, url: Optional[str] = None) -> Dict[str, Any]:
@@ -182,36 +291,18 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 if url:
-                    page.goto(url)
-
-                # Wait for element to be visible
-                page.wait_for_selector(selector)
-                element = page.locator(selector)
-
-                # Fill the form field
-                element.fill(text)
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
 
-                browser.close()
+                # Fill the form field (waits for it to be visible and editable)
+                page.fill(selector, text, timeout=self.config["timeout"])
 
-                self.logger.info(f"Filled form: {selector} with text: {text[:50]}...")
-                return {"success": True, "action": "filled", "selector": selector, "text": text}
+            self.logger.info("Filled form: %s with text: %.50s...", selector, text)
+            return {"success": True, "action": "filled", "selector": selector, "text": text}
 
         except Exception as e:
-            self.logger.error(f"Error filling form {selector}: {e}")
+            self.logger.error("Error filling form %s: %s", selector, e)
             return {"success": False, "error": str(e)}
 
     def take_screenshot(self, selector: Optional[str] = None, url: Optional[str] = None) -> Dict[str, Any]:
@@ -226,24 +317,12 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status and screenshot path
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 if url:
-                    page.goto(url)
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
 
                 # Take screenshot
-                screenshot_path = f"screenshot_{int(time.time())}.png"
+                screenshot_path = self._next_screenshot_path()
 
                 if selector:
                     element = page.locator(selector)
@@ -251,13 +330,11 @@ class MCPBrowserServer:
                 else:
                     page.screenshot(path=screenshot_path)
 
-                browser.close()
-
-                self.logger.info(f"Screenshot taken: {screenshot_path}")
-                return {"success": True, "screenshot": screenshot_path}
+            self.logger.info("Screenshot taken: %s", screenshot_path)
+            return {"success": True, "screenshot": screenshot_path}
 
         except Exception as e:
-            self.logger.error(f"Error taking screenshot: {e}")
+            self.logger.error("Error taking screenshot: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_page_content(self, selector: Optional[str] = None, url: Optional[str] = None) -> Dict[str, Any]:
@@ -272,35 +349,21 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status and content
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 if url:
-                    page.goto(url)
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
 
                 # Get content
                 if selector:
-                    content = page.locator(selector).text_content() or ""
+                    content = page.text_content(selector, timeout=self.config["timeout"]) or ""
                 else:
                     content = page.content()
 
-                browser.close()
-
-                self.logger.info(f"Got page content from {url or 'current page'}")
-                return {"success": True, "content": content}
+            self.logger.info("Got page content from %s", url or 'current page')
+            return {"success": True, "content": content}
 
         except Exception as e:
-            self.logger.error(f"Error getting page content: {e}")
+            self.logger.error("Error getting page content: %s", e)
             return {"success": False, "error": str(e)}
 
     def login(self, url: str, username_selector: str, password_selector: str,
@@ -320,14 +383,7 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status
         """
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 # Navigate to login page
                 page.goto(url)
 
@@ -339,15 +395,17 @@ class MCPBrowserServer:
                 page.click(submit_selector)
 
                 # Wait for navigation
-                page.wait_for_url(url, timeout=10000, state="present")
+                page.wait_for_url(url, timeout=10000)
 
-                browser.close()
+                # Keep the session for later calls' contexts; pooled pages predate it
+                page.context.storage_state(path=str(self.storage_state_path))
+                self._drain_page_pool()
 
-                self.logger.info(f"Successfully logged in to {url}")
-                return {"success": True, "action": "logged_in", "url": url}
+            self.logger.info("Successfully logged in to %s", url)
+            return {"success": True, "action": "logged_in", "url": url}
 
         except Exception as e:
-            self.logger.error(f"Error logging in to {url}: {e}")
+            self.logger.error("Error logging in to %s: %s", url, e)
             return {"success": False, "error": str(e)}
 
     def get_element_text(self, selector: str, url: Optional[str] = None) -> Dict[str, Any]:
@@ -362,36 +420,18 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status and text
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 if url:
-                    page.goto(url)
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
 
-                # Wait for element to be visible
-                page.wait_for_selector(selector)
-                element = page.locator(selector)
+                # Get text content (waits for the element)
+                text = page.text_content(selector, timeout=self.config["timeout"])
 
-                # Get text content
-                text = element.text_content()
-
-                browser.close()
-
-                self.logger.info(f"Got element text: {selector}")
-                return {"success": True, "text": text}
+            self.logger.info("Got element text: %s", selector)
+            return {"success": True, "text": text}
 
         except Exception as e:
-            self.logger.error(f"Error getting element text {selector}: {e}")
+            self.logger.error("Error getting element text %s: %s", selector, e)
             return {"success": False, "error": str(e)}
 
     def get_element_attribute(self, selector: str, attribute: str,
@@ -408,36 +448,18 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status and attribute value
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
-                    headless=self.config["browser"]["headless"],
-                    args=self.config["browser"]["args"]
-                )
-                page = browser.new_page()
-
+            with self._page() as page:
                 if url:
-                    page.goto(url)
-
-                # Wait for element to be visible
-                page.wait_for_selector(selector)
-                element = page.locator(selector)
-
-                # Get attribute value
-                attribute_value = element.get_attribute(attribute)
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
 
-                browser.close()
+                # Get attribute value (waits for the element)
+                attribute_value = page.get_attribute(selector, attribute, timeout=self.config["timeout"])
 
-                self.logger.info(f"Got element attribute: {selector} {attribute}")
-                return {"success": True, "attribute": attribute_value}
+            self.logger.info("Got element attribute: %s %s", selector, attribute)
+            return {"success": True, "attribute": attribute_value}
 
         except Exception as e:
-            self.logger.error(f"Error getting element attribute {selector} {attribute}: {e}")
+            self.logger.error("Error getting element attribute %s %s: %s", selector, attribute, e)
             return {"success": False, "error": str(e)}
 
     def wait_for_element(self, selector: str, timeout: int = 30000,
@@ -454,37 +476,237 @@ class MCPBrowserServer:
             Dict[str, Any]: Result with success status
         """
         try:
-            if url:
-                navigate_result = self.navigate(url)
-                if not navigate_result["success"]:
-                    return navigate_result
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    self.config["session_path"],
+            with self._page() as page:
+                if url:
+                    page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+
+                # Wait for element to be visible
+                page.wait_for_selector(selector, timeout=timeout)
+
+            self.logger.info("Element appeared: %s", selector)
+            return {"success": True, "action": "waited_for_element", "selector": selector}
+
+        except Exception as e:
+            self.logger.error("Error waiting for element %s: %s", selector, e)
+            return {"success": False, "error": str(e)}
+
+class AsyncMCPBrowserServer(_BrowserServerBase):
+    """
+    asyncio variant of MCPBrowserServer: one browser, one short-lived context per call, so callers
+    can asyncio.gather many calls. Concurrent contexts are capped by config "max_concurrency".
+    Config, logging and the saved login session are shared with the sync server; use it as an
+    async context manager (async with) to close the browser.
+    """
+
+    def __init__(self, config_path: str = "mcp_browser_config.json"):
+        super().__init__(config_path)
+        self._semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 4))
+        self._browser_lock = asyncio.Lock()
+
+    async def _get_browser(self):
+        """Browser shared by all calls, launched on first use."""
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
                     headless=self.config["browser"]["headless"],
                     args=self.config["browser"]["args"]
                 )
-                page = browser.new_page()
+        return self._browser
+
+    @asynccontextmanager
+    async def _page(self):
+        """Yield a page in a fresh context carrying the saved login session."""
+        async with self._semaphore:
+            browser = await self._get_browser()
+            storage_state = str(self.storage_state_path) if self.storage_state_path.exists() else None
+            context = await browser.new_context(storage_state=storage_state)
+            try:
+                yield await context.new_page()
+            finally:
+                await context.close()
+
+    async def close(self):
+        """Close the shared browser and stop Playwright."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def navigate(self, url: str, wait_until: str = "networkidle") -> Dict[str, Any]:
+        """Navigate to a URL (see MCPBrowserServer.navigate)."""
+        try:
+            self.logger.info("Navigating to: %s", url)
+
+            async with self._page() as page:
+                await page.goto(url, wait_until=wait_until)
+                content = await page.content()
+                page_info = {
+                    "url": page.url,
+                    "title": await page.title(),
+                    "content": content[:1000] + "..." if len(content) > 1000 else content
+                }
+
+            self.logger.info("Successfully navigated to %s", url)
+            return {"success": True, "page": page_info}
+
+        except Exception as e:
+            self.logger.error("Error navigating to %s: %s", url, e)
+            return {"success": False, "error": str(e)}
 
+    async def click_element(self, selector: str, url: Optional[str] = None,
+                            wait_after: Optional[str] = None) -> Dict[str, Any]:
+        """Click on an element (see MCPBrowserServer.click_element)."""
+        try:
+            async with self._page() as page:
                 if url:
-                    page.goto(url)
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+                if wait_after == "navigation":
+                    async with page.expect_navigation(wait_until="domcontentloaded", timeout=self.config["timeout"]):
+                        await page.click(selector, timeout=self.config["timeout"])
+                else:
+                    await page.click(selector, timeout=self.config["timeout"])
+                    if wait_after == "network_idle":
+                        await page.wait_for_load_state("networkidle", timeout=self.config["timeout"])
 
-                # Wait for element to be visible
-                page.wait_for_selector(selector, timeout=timeout)
+            self.logger.info("Clicked element: %s", selector)
+            return {"success": True, "action": "clicked", "selector": selector}
 
-                browser.close()
+        except Exception as e:
+            self.logger.error("Error clicking element %s: %s", selector, e)
+            return {"success": False, "error": str(e)}
+
+    async def fill_form(self, selector: str, text: str, url: Optional[str] = None) -> Dict[str, Any]:
+        """Fill a form field (see MCPBrowserServer.fill_form)."""
+        try:
+            async with self._page() as page:
+                if url:
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+                await page.fill(selector, text, timeout=self.config["timeout"])
+
+            self.logger.info("Filled form: %s with text: %.50s...", selector, text)
+            return {"success": True, "action": "filled", "selector": selector, "text": text}
+
+        except Exception as e:
+            self.logger.error("Error filling form %s: %s", selector, e)
+            return {"success": False, "error": str(e)}
+
+    async def take_screenshot(self, selector: Optional[str] = None, url: Optional[str] = None) -> Dict[str, Any]:
+        """Take a screenshot of the page or a specific element (see MCPBrowserServer.take_screenshot)."""
+        try:
+            async with self._page() as page:
+                if url:
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+
+                screenshot_path = self._next_screenshot_path()
+                if selector:
+                    await page.locator(selector).screenshot(path=screenshot_path)
+                else:
+                    await page.screenshot(path=screenshot_path)
+
+            self.logger.info("Screenshot taken: %s", screenshot_path)
+            return {"success": True, "screenshot": screenshot_path}
+
+        except Exception as e:
+            self.logger.error("Error taking screenshot: %s", e)
+            return {"success": False, "error": str(e)}
+
+    async def get_page_content(self, selector: Optional[str] = None, url: Optional[str] = None) -> Dict[str, Any]:
+        """Get page content or content of a specific element (see MCPBrowserServer.get_page_content)."""
+        try:
+            async with self._page() as page:
+                if url:
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+                if selector:
+                    content = await page.text_content(selector, timeout=self.config["timeout"]) or ""
+                else:
+                    content = await page.content()
+
+            self.logger.info("Got page content from %s", url or 'current page')
+            return {"success": True, "content": content}
+
+        except Exception as e:
+            self.logger.error("Error getting page content: %s", e)
+            return {"success": False, "error": str(e)}
+
+    async def login(self, url: str, username_selector: str, password_selector: str,
+                    submit_selector: str, username: str, password: str) -> Dict[str, Any]:
+        """Login to a website and save the session for later calls (see MCPBrowserServer.login)."""
+        try:
+            async with self._page() as page:
+                await page.goto(url)
+                await page.fill(username_selector, username)
+                await page.fill(password_selector, password)
+                await page.click(submit_selector)
+                await page.wait_for_url(url, timeout=10000)
+                await page.context.storage_state(path=str(self.storage_state_path))
+
+            self.logger.info("Successfully logged in to %s", url)
+            return {"success": True, "action": "logged_in", "url": url}
+
+        except Exception as e:
+            self.logger.error("Error logging in to %s: %s", url, e)
+            return {"success": False, "error": str(e)}
+
+    async def get_element_text(self, selector: str, url: Optional[str] = None) -> Dict[str, Any]:
+        """Get text content of an element (see MCPBrowserServer.get_element_text)."""
+        try:
+            async with self._page() as page:
+                if url:
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+                text = await page.text_content(selector, timeout=self.config["timeout"])
+
+            self.logger.info("Got element text: %s", selector)
+            return {"success": True, "text": text}
+
+        except Exception as e:
+            self.logger.error("Error getting element text %s: %s", selector, e)
+            return {"success": False, "error": str(e)}
+
+    async def get_element_attribute(self, selector: str, attribute: str,
+                                    url: Optional[str] = None) -> Dict[str, Any]:
+        """Get attribute value of an element (see MCPBrowserServer.get_element_attribute)."""
+        try:
+            async with self._page() as page:
+                if url:
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+                attribute_value = await page.get_attribute(selector, attribute, timeout=self.config["timeout"])
+
+            self.logger.info("Got element attribute: %s %s", selector, attribute)
+            return {"success": True, "attribute": attribute_value}
+
+        except Exception as e:
+            self.logger.error("Error getting element attribute %s %s: %s", selector, attribute, e)
+            return {"success": False, "error": str(e)}
+
+    async def wait_for_element(self, selector: str, timeout: int = 30000,
+                               url: Optional[str] = None) -> Dict[str, Any]:
+        """Wait for an element to appear (see MCPBrowserServer.wait_for_element)."""
+        try:
+            async with self._page() as page:
+                if url:
+                    await page.goto(url, wait_until=self.config.get("wait_until", "domcontentloaded"))
+                await page.wait_for_selector(selector, timeout=timeout)
 
-                self.logger.info(f"Element appeared: {selector}")
-                return {"success": True, "action": "waited_for_element", "selector": selector}
+            self.logger.info("Element appeared: %s", selector)
+            return {"success": True, "action": "waited_for_element", "selector": selector}
 
         except Exception as e:
-            self.logger.error(f"Error waiting for element {selector}: {e}")
+            self.logger.error("Error waiting for element %s: %s", selector, e)
             return {"success": False, "error": str(e)}
 
 if __name__ == "__main__":
     # Example usage
     browser = MCPBrowserServer()
+    atexit.register(browser.close)
 
     # Test navigation
     result = browser.navigate("https://example.com")
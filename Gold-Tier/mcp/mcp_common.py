@@ -0,0 +1,82 @@
+"""
+MCP Common - Logging and config helpers shared by the MCP servers
+"""
+
+import copy
+import json
+import time
+import atexit
+import logging
+import logging.handlers
+import threading
+import functools
+from pathlib import Path
+from typing import Dict, Any
+
+# Log line format shared by the file and console handlers
+LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+class _UnflushedFileHandler(logging.FileHandler):
+    """FileHandler whose emit leaves records in the stream buffer; flush() writes them out."""
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target once per batch instead of once per record."""
+
+    def flush(self):
+        with self.lock:
+            super().flush()
+            if self.target:
+                self.target.flush()
+
+def buffered_file_handler(filename: str) -> logging.Handler:
+    """
+    Create a log file handler that writes in batches: on errors, every 256 records,
+    every half second and at exit. The file is opened on the first write.
+
+    Args:
+        filename (str): Log file path
+
+    Returns:
+        logging.Handler: Handler to add to a logger
+    """
+    log_file = _UnflushedFileHandler(filename, delay=True)
+    log_file.setFormatter(LOG_FORMATTER)
+    handler = _BatchMemoryHandler(capacity=256, flushLevel=logging.ERROR, target=log_file, flushOnClose=True)
+    atexit.register(handler.flush)
+    start_periodic_flush(handler)
+    return handler
+
+def start_periodic_flush(handler: logging.Handler, interval: float = 0.5):
+    """Flush a buffering log handler every `interval` seconds from a daemon thread."""
+    def flush_loop():
+        while True:
+            time.sleep(interval)
+            handler.flush()
+
+    threading.Thread(target=flush_loop, name='log-flush', daemon=True).start()
+
+@functools.lru_cache(maxsize=8)
+def _parse_json(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON file; the result is cached until the file's mtime changes and must not be mutated."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_json(path: Path) -> Dict[str, Any]:
+    """
+    Load a JSON file, parsing it only when it changed since the last load.
+
+    Args:
+        path (Path): JSON file to read
+
+    Returns:
+        Dict[str, Any]: A copy of the parsed data, safe for the caller to modify
+    """
+    return copy.deepcopy(_parse_json(str(path), path.stat().st_mtime))
@@ -4,16 +4,61 @@ MCP Email Server - Model Context Protocol server for email actions
 Provides email sending capabilities through the MCP interface for Claude Code.
 """
 
+import io
+import copy
 import os
+import base64
+import re
 import json
 import logging
 import smtplib
 from pathlib import Path
+from email.utils import parseaddr
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
-from typing import Dict, List, Optional, Any
+from mcp_common import LOG_FORMATTER, buffered_file_handler, load_json
+from typing import Dict, List, Optional, Any, Iterable
+
+# Config written on first run when there is no config file (environment read once, at import)
+DEFAULT_CONFIG = {
+    "email": {
+        "host": "smtp.gmail.com",
+        "port": 587,
+        "use_tls": True,
+        "use_ssl": False,
+        "credentials": {
+            "username": os.environ.get("EMAIL_USERNAME"),
+            "password": os.environ.get("EMAIL_PASSWORD")
+        }
+    },
+    "defaults": {
+        "from": os.environ.get("DEFAULT_FROM_EMAIL"),
+        "reply_to": os.environ.get("DEFAULT_REPLY_TO_EMAIL")
+    }
+}
+
+# Email address check; \Z (not $) so a trailing newline doesn't pass
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# Built-in email templates by name
+EMAIL_TEMPLATES = {t["name"]: t for t in [
+    {
+        "name": "welcome",
+        "subject": "Welcome to Our Service!",
+        "body": "Hello {name},\n\nThank you for joining our service. We're excited to have you on board!\n\nBest regards,\nYour Team"
+    },
+    {
+        "name": "invoice",
+        "subject": "Invoice {invoice_number}",
+        "body": "Hello {name},\n\nPlease find attached Invoice #{invoice_number} for {amount}.\n\nPayment is due by {due_date}.\n\nBest regards,\nYour Team"
+    },
+    {
+        "name": "follow_up",
+        "subject": "Following up on our conversation",
+        "body": "Hello {name},\n\nI wanted to follow up on our recent conversation about {topic}. Do you have any questions or need further information?\n\nBest regards,\nYour Team"
+    }
+]}
 
 class MCPEmailServer:
     def __init__(self, config_path: str = "mcp_email_config.json"):
@@ -26,36 +71,33 @@ class MCPEmailServer:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.logger = self._setup_logger()
+
+        # SMTP settings, resolved once from the config
+        email_config = self.config["email"]
+        self._smtp_host = email_config["host"]
+        self._smtp_port = email_config["port"]
+        self._use_ssl = bool(email_config["use_ssl"])
+        self._use_tls = bool(email_config["use_tls"])
+        self._smtp_user = email_config["credentials"]["username"]
+        self._smtp_password = email_config["credentials"]["password"]
+
+        # Open SMTP connection, reused across sends (see _get_smtp_server)
+        self._smtp = None
+
         self.logger.info("MCP Email Server initialized")
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                return load_json(self.config_path)
             else:
                 # Create default config
-                default_config = {
-                    "email": {
-                        "host": "smtp.gmail.com",
-                        "port": 587,
-                        "use_tls": true,
-                        "use_ssl": false,
-                        "credentials": {
-                            "username": os.getenv("EMAIL_USERNAME"),
-                            "password": os.getenv("EMAIL_PASSWORD")
-                        }
-                    },
-                    "defaults": {
-                        "from": os.getenv("DEFAULT_FROM_EMAIL"),
-                        "reply_to": os.getenv("DEFAULT_REPLY_TO_EMAIL")
-                    }
-                }
+                default_config = copy.deepcopy(DEFAULT_CONFIG)
                 self._save_config(default_config)
                 return default_config
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
+            self.logger.error("Error loading config: %s", e)
             raise
 
     def _save_config(self, config: Dict[str, Any]):
@@ -64,29 +106,29 @@ class MCPEmailServer:
             with open(self.config_path, 'w') as f:
                 json.dump(config, f, indent=2)
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
 
     def _setup_logger(self):
         """Set up logging."""
         logger = logging.getLogger('MCPEmailServer')
+
+        # Already set up by an earlier instance - don't open another log file
+        if logger.handlers:
+            return logger
+
         logger.setLevel(logging.INFO)
 
-        # Create handlers
-        file_handler = logging.FileHandler('mcp_email_server.log')
+        # Create handlers; file writes are batched (see buffered_file_handler)
+        file_handler = buffered_file_handler('mcp_email_server.log')
         file_handler.setLevel(logging.INFO)
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-
-        # Create formatter and add to handlers
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(LOG_FORMATTER)
 
         # Add handlers to logger
-        if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
 
         return logger
 
@@ -119,10 +161,9 @@ class MCPEmailServer:
             Dict[str, Any]: Result with success status and message
         """
         try:
-            self.logger.info(f"Sending email to: {to}, subject: {subject}")
+            self.logger.info("Sending email to: %s, subject: %s", to, subject)
 
             # Get email configuration
-            email_config = self.config["email"]
             defaults = self.config["defaults"]
 
             # Set from and reply-to addresses
@@ -132,6 +173,14 @@ class MCPEmailServer:
             if not from_addr:
                 raise ValueError("No from email address configured")
 
+            # Check the bare address of each recipient, so "Name <addr>" forms stay accepted
+            recipients = [to, *(cc or ()), *(bcc or ())]
+            addr_specs = [parseaddr(addr)[1] for addr in recipients]
+            invalid_specs = set(self.validate_emails(addr_specs))
+            invalid = [addr for addr, spec in zip(recipients, addr_specs) if spec in invalid_specs]
+            if invalid:
+                raise ValueError(f"Invalid recipient address(es): {', '.join(invalid)}")
+
             if approval_required:
                 # Create approval request instead of sending
                 approval_result = self._create_approval_request(
@@ -161,7 +210,7 @@ class MCPEmailServer:
                     self._attach_file(msg, attachment_path)
 
             # Connect to SMTP server
-            server = self._get_smtp_server(email_config)
+            server = self._get_smtp_server()
 
             # Send email
             to_addrs = [to]
@@ -170,87 +219,99 @@ class MCPEmailServer:
             if bcc:
                 to_addrs.extend(bcc)
 
-            server.sendmail(from_addr, to_addrs, msg.as_string())
-            server.quit()
+            try:
+                server.send_message(msg, from_addr=from_addr, to_addrs=to_addrs)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle connection between the NOOP and the send
+                self._smtp = None
+                server = self._get_smtp_server()
+                server.send_message(msg, from_addr=from_addr, to_addrs=to_addrs)
 
-            self.logger.info(f"Email sent successfully to {to}")
+            self.logger.info("Email sent successfully to %s", to)
             return {"success": True, "message": "Email sent successfully"}
 
         except Exception as e:
-            self.logger.error(f"Error sending email: {e}")
+            self.logger.error("Error sending email: %s", e)
             return {"success": False, "error": str(e)}
 
-    def _get_smtp_server(self, config: Dict[str, Any]):
-        """Get configured SMTP server."""
-        if config["use_ssl"]:
-            server = smtplib.SMTP_SSL(config["host"], config["port"])
+    def _get_smtp_server(self):
+        """Get the open SMTP connection, connecting (and logging in) only if there is none or it went stale."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+
+        if self._use_ssl:
+            server = smtplib.SMTP_SSL(self._smtp_host, self._smtp_port)
         else:
-            server = smtplib.SMTP(config["host"], config["port"])
-            if config["use_tls"]:
+            server = smtplib.SMTP(self._smtp_host, self._smtp_port)
+            if self._use_tls:
                 server.starttls()
 
         # Login
-        if config["credentials"]["username"] and config["credentials"]["password"]:
-            server.login(config["credentials"]["username"], config["credentials"]["password"])
+        if self._smtp_user and self._smtp_password:
+            server.login(self._smtp_user, self._smtp_password)
 
+        self._smtp = server
         return server
 
+    def close(self):
+        """Close the SMTP connection."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+
     def _attach_file(self, msg: MIMEMultipart, file_path: str):
         """Attach a file to the email."""
         try:
             attachment = MIMEBase('application', 'octet-stream')
-            with open(file_path, 'rb') as f:
-                attachment.set_payload(f.read())
 
-            encoders.encode_base64(attachment)
+            # Base64-encode straight from the file in chunks instead of reading it whole first
+            encoded = io.BytesIO()
+            with open(file_path, 'rb') as f:
+                base64.encode(f, encoded)
+            attachment.set_payload(encoded.getvalue().decode('ascii'))
+            attachment['Content-Transfer-Encoding'] = 'base64'
             attachment.add_header('Content-Disposition', f'attachment; filename={Path(file_path).name}')
             msg.attach(attachment)
 
-            self.logger.info(f"Attached file: {file_path}")
+            self.logger.info("Attached file: %s", file_path)
 
         except Exception as e:
-            self.logger.error(f"Error attaching file {file_path}: {e}")
+            self.logger.error("Error attaching file %s: %s", file_path, e)
 
     def get_email_templates(self) -> List[Dict[str, Any]]:
         """Get available email templates."""
-        return [
-            {
-                "name": "welcome",
-                "subject": "Welcome to Our Service!",
-                "body": "Hello {name},\n\nThank you for joining our service. We're excited to have you on board!\n\nBest regards,\nYour Team"
-            },
-            {
-                "name": "invoice",
-                "subject": "Invoice {invoice_number}",
-                "body": "Hello {name},\n\nPlease find attached Invoice #{invoice_number} for {amount}.\n\nPayment is due by {due_date}.\n\nBest regards,\nYour Team"
-            },
-            {
-                "name": "follow_up",
-                "subject": "Following up on our conversation",
-                "body": "Hello {name},\n\nI wanted to follow up on our recent conversation about {topic}. Do you have any questions or need further information?\n\nBest regards,\nYour Team"
-            }
-        ]
+        return list(EMAIL_TEMPLATES.values())
 
     def render_template(self, template_name: str, variables: Dict[str, str]) -> Dict[str, str]:
         """Render an email template with variables."""
-        templates = self.get_email_templates()
-        template = next((t for t in templates if t["name"] == template_name), None)
+        template = EMAIL_TEMPLATES.get(template_name)
 
         if not template:
             return {"success": False, "error": "Template not found"}
 
         try:
-            subject = template["subject"].format(**variables)
-            body = template["body"].format(**variables)
+            subject = template["subject"].format_map(variables)
+            body = template["body"].format_map(variables)
             return {"success": True, "subject": subject, "body": body}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     def validate_email(self, email: str) -> bool:
         """Validate an email address."""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_RE.match(email) is not None
+
+    def validate_emails(self, emails: Iterable[str]) -> List[str]:
+        """Validate several email addresses; returns the invalid ones."""
+        match = EMAIL_RE.match
+        return [email for email in emails if match(email) is None]
 
 if __name__ == "__main__":
     # Example usage
@@ -4,11 +4,74 @@ Base Watcher Class - Template for all watchers
 Provides the core architecture for monitoring systems and triggering AI processing.
 """
 
+import os
+import sys
 import time
 import logging
 from pathlib import Path
 from abc import ABC, abstractmethod
 
+def atomic_write_text(path: Path, data: str):
+    """
+    Replace the contents of a file without ever leaving it half-written.
+
+    Args:
+        path (Path): File to write
+        data (str): New file contents
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_text(data, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+def atomic_write_lines(path: Path, lines):
+    """
+    Atomically replace a file with one line per item, streamed to disk.
+
+    Args:
+        path (Path): File to write
+        lines: Iterable of strings, written without building one big string
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', buffering=65536) as f:
+        f.writelines(line + '\n' for line in lines)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+class BannerFormatter(logging.Formatter):
+    """Formats a record as a boxed console banner; the first message line is the title."""
+
+    rule = '=' * 60
+
+    def format(self, record):
+        title, _, details = record.getMessage().partition('\n')
+        lines = [self.rule, f'  {title}', self.rule]
+        if details:
+            lines.extend(f'  {line}' if line else '' for line in details.split('\n'))
+            lines.append(self.rule)
+        return '\n' + '\n'.join(lines) + '\n'
+
+def get_banner_logger(name: str) -> logging.Logger:
+    """
+    Get a logger that prints boxed status banners to stdout.
+
+    Args:
+        name (str): Name of the owning component, e.g. 'LinkedInPoster'
+
+    Returns:
+        logging.Logger: Logger writing through BannerFormatter, not propagated to file handlers
+    """
+    banner_logger = logging.getLogger(f'{name}.banner')
+    if not banner_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(BannerFormatter())
+        banner_logger.addHandler(handler)
+        banner_logger.setLevel(logging.INFO)
+        banner_logger.propagate = False
+    return banner_logger
+
 class BaseWatcher(ABC):
     def __init__(self, vault_path: str, check_interval: int = 60):
         """
@@ -25,7 +88,7 @@ class BaseWatcher(ABC):
 
         # Create folders if they don't exist
         self.needs_action.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f'Initialized {self.__class__.__name__} watching {self.vault_path}')
+        self.logger.info('Initialized %s watching %s', self.__class__.__name__, self.vault_path)
 
     @abstractmethod
     def check_for_updates(self) -> list:
@@ -50,19 +113,34 @@ class BaseWatcher(ABC):
         """
         pass
 
+    def finish_batch(self):
+        """
+        Called once after each check's action files are created. Subclasses persist
+        state recorded while handling the batch here.
+        """
+        pass
+
+    def wait_for_next_check(self):
+        """
+        Block until the next check is due. Subclasses that get pushed notifications
+        can return early when one arrives.
+        """
+        time.sleep(self.check_interval)
+
     def run(self):
         """
         Main watcher loop. Continuously checks for updates.
         """
-        self.logger.info(f'Starting {self.__class__.__name__}')
+        self.logger.info('Starting %s', self.__class__.__name__)
         while True:
             try:
                 items = self.check_for_updates()
                 for item in items:
                     self.create_action_file(item)
+                self.finish_batch()
             except Exception as e:
-                self.logger.error(f'Error in {self.__class__.__name__}: {e}')
-            time.sleep(self.check_interval)
+                self.logger.error('Error in %s: %s', self.__class__.__name__, e)
+            self.wait_for_next_check()
 
 if __name__ == "__main__":
     # Basic test to verify the base class works
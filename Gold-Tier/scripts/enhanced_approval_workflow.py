@@ -14,6 +14,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Callable
 from threading import Thread, Event
 
+import orjson
+
 class EnhancedApprovalWorkflow:
     def __init__(self, config_path: str = "approval_config.json"):
         """Initialize the enhanced approval workflow."""
@@ -122,14 +124,12 @@ class EnhancedApprovalWorkflow:
     def _load_persisted_queue(self):
         """Load persisted approval queue."""
         if self.persistence_file.exists():
-            with open(self.persistence_file, 'r') as f:
-                self.approval_queue = json.load(f)
+            self.approval_queue = orjson.loads(self.persistence_file.read_bytes())
             self.logger.info(f"Loaded {len(self.approval_queue)} persisted approvals")
 
     def _save_persisted_queue(self):
         """Save approval queue to persistence file."""
-        with open(self.persistence_file, 'w') as f:
-            json.dump(self.approval_queue, f, indent=2)
+        self.persistence_file.write_bytes(orjson.dumps(self.approval_queue, option=orjson.OPT_INDENT_2))
 
     def _start_notification_service(self):
         """Start the notification service."""
@@ -505,8 +505,7 @@ class EnhancedApprovalWorkflow:
         audit_log_file = Path(self.config["approval"]["audit"]["log_file"])
         audit_log = []
         if audit_log_file.exists():
-            with open(audit_log_file, 'r') as f:
-                audit_log = json.load(f)
+            audit_log = orjson.loads(audit_log_file.read_bytes())
 
         audit_log.append(audit_entry)
 
@@ -515,8 +514,7 @@ class EnhancedApprovalWorkflow:
         audit_log = [entry for entry in audit_log if datetime.fromisoformat(entry["timestamp"]) > retention_date]
 
         # Save audit log
-        with open(audit_log_file, 'w') as f:
-            json.dump(audit_log, f, indent=2)
+        audit_log_file.write_bytes(orjson.dumps(audit_log, option=orjson.OPT_INDENT_2))
 
     def get_pending_approvals(self) -> List[Dict[str, Any]]:
         """Get all pending approval requests."""
@@ -5,15 +5,77 @@ Triggers when new important emails arrive and creates action files for the AI to
 """
 
 import time
+import asyncio
 import logging
 import httplib2
 from pathlib import Path
+from binascii import a2b_base64
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from base_watcher import BaseWatcher
+from googleapiclient.errors import HttpError
+from base_watcher import BaseWatcher, atomic_write_lines
 from datetime import datetime
 from audit_logger import get_audit_logger
 
+# Partial response for messages.get - only the fields create_action_file reads
+MESSAGE_FIELDS = 'id,payload(headers,body/data,parts(mimeType,body/data))'
+
+# Upper bound on in-flight messages.get calls when the batch endpoint fails
+MAX_CONCURRENT_FETCHES = 10
+
+# Action file layout, rendered with str.format
+ACTION_FILE_TEMPLATE = """---
+type: email
+from: {sender}
+subject: {subject}
+received: {received}
+priority: high
+status: pending
+---
+
+# Email Content
+
+{body}
+
+# Suggested Actions
+
+- [ ] Review email content
+- [ ] Determine appropriate response
+- [ ] Draft reply if needed
+- [ ] Take required action based on email content
+- [ ] Move to appropriate folder after processing
+
+# Email Details
+
+**From:** {sender}
+**Subject:** {subject}
+**Date:** {date}
+**Message ID:** {message_id}
+
+# Quick Actions
+
+- [ ] Mark as read
+- [ ] Archive after processing
+- [ ] Forward to relevant party if needed
+- [ ] Create calendar event if it's a meeting request
+
+---
+*Generated by Gmail Watcher*
+"""
+
+def render_action_file(fields: dict) -> str:
+    """
+    Render the markdown action file for an email.
+
+    Args:
+        fields (dict): sender, subject, received, body, date and message_id values
+
+    Returns:
+        str: Action file content
+    """
+    return ACTION_FILE_TEMPLATE.format_map(fields)
+
 class GmailWatcher(BaseWatcher):
     def __init__(self, vault_path: str, check_interval: int = 120):
         """
@@ -28,6 +90,7 @@ class GmailWatcher(BaseWatcher):
         self.token_path = Path('token.json')
         self.credentials_path = Path('credentials.json')
         self.processed_ids = set()
+        self.prefetched = {}
         self.service = None
 
         # Set up logging
@@ -39,7 +102,7 @@ class GmailWatcher(BaseWatcher):
         # Initialize Gmail service
         self._initialize_service()
 
-        self.logger.info(f'GmailWatcher initialized')
+        self.logger.info('GmailWatcher initialized')
 
     def _initialize_service(self):
         """Initialize the Gmail API service."""
@@ -58,17 +121,26 @@ class GmailWatcher(BaseWatcher):
             self.service = build('gmail', 'v1', credentials=self.creds, cache_discovery=False)
 
             # Load previously processed email IDs
-            processed_file = Path(self.vault_path) / 'processed_emails.txt'
-            if processed_file.exists():
-                with open(processed_file, 'r') as f:
-                    self.processed_ids = set(f.read().splitlines())
+            self.processed_file = Path(self.vault_path) / 'processed_emails.txt'
+            if self.processed_file.exists():
+                raw = self.processed_file.read_text(encoding='utf-8')
+                lines = raw.splitlines()
+                self.processed_ids = set(lines)
+
+                # Compact duplicates (and a missing trailing newline) so appends stay one ID per line
+                if lines and (len(lines) != len(self.processed_ids) or not raw.endswith('\n')):
+                    self._compact_processed_ids()
 
             self.logger.info('Gmail API service initialized')
 
         except Exception as e:
-            self.logger.error(f'Error initializing Gmail service: {e}')
+            self.logger.error('Error initializing Gmail service: %s', e)
             raise
 
+    def _compact_processed_ids(self):
+        """Rewrite processed_emails.txt with each known ID once, sorted."""
+        atomic_write_lines(self.processed_file, sorted(self.processed_ids))
+
     def check_for_updates(self) -> list:
         """
         Check for new important emails.
@@ -91,13 +163,79 @@ class GmailWatcher(BaseWatcher):
             # Filter out already processed emails
             new_messages = [m for m in messages if m['id'] not in self.processed_ids]
 
-            self.logger.info(f'Found {len(new_messages)} new important emails')
+            self.logger.info('Found %d new important emails', len(new_messages))
+
+            # Fetch all new messages up front instead of one round-trip per email
+            if new_messages:
+                self.prefetched = self._fetch_messages([m['id'] for m in new_messages])
+
             return new_messages
 
         except Exception as e:
-            self.logger.error(f'Error checking for emails: {e}')
+            self.logger.error('Error checking for emails: %s', e)
             return []
 
+    def _get_message_request(self, message_id: str):
+        """Build a messages.get request for a single email."""
+        return self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='full',
+            fields=MESSAGE_FIELDS
+        )
+
+    def _fetch_messages(self, message_ids: list) -> dict:
+        """
+        Fetch several emails at once.
+
+        Uses the Gmail batch endpoint and falls back to concurrent single
+        requests if the batch call fails.
+
+        Args:
+            message_ids (list): IDs of the messages to fetch
+
+        Returns:
+            dict: Message ID -> message resource for every fetched email
+        """
+        fetched = {}
+
+        def _on_response(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+
+        try:
+            batch = self.service.new_batch_http_request(callback=_on_response)
+            for message_id in message_ids:
+                batch.add(self._get_message_request(message_id), request_id=message_id)
+            batch.execute()
+            return fetched
+        except HttpError as e:
+            self.logger.warning('Batch fetch failed, falling back to concurrent requests: %s', e)
+
+        try:
+            return asyncio.run(self._fetch_many_async(message_ids))
+        except Exception as e:
+            self.logger.error('Error fetching emails: %s', e)
+            return fetched
+
+    async def _fetch_many_async(self, message_ids: list) -> dict:
+        """Fetch messages concurrently, at most MAX_CONCURRENT_FETCHES at a time."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def _fetch_one(message_id):
+            async with semaphore:
+                # httplib2 is not thread-safe, so each request gets its own connection
+                http = AuthorizedHttp(self.creds, http=httplib2.Http())
+                request = self._get_message_request(message_id)
+                try:
+                    return message_id, await asyncio.to_thread(request.execute, http=http)
+                except HttpError as e:
+                    self.logger.error('Error fetching email %s: %s', message_id, e)
+                    return message_id, None
+
+        results = await asyncio.gather(*(_fetch_one(message_id) for message_id in message_ids))
+        return {message_id: msg for message_id, msg in results if msg is not None}
+
     def create_action_file(self, message) -> Path:
         """
         Create an action file for an email.
@@ -109,11 +247,10 @@ class GmailWatcher(BaseWatcher):
             Path: Path to the created action file
         """
         try:
-            # Get the full email message
-            msg = self.service.users().messages().get(
-                userId='me',
-                id=message['id']
-            ).execute()
+            # Use the prefetched message, or fetch it if the bulk fetch missed it
+            msg = self.prefetched.pop(message['id'], None)
+            if msg is None:
+                msg = self._get_message_request(message['id']).execute()
 
             # Extract headers
             headers = {h['name']: h['value'] for h in msg['payload']['headers']}
@@ -133,81 +270,50 @@ class GmailWatcher(BaseWatcher):
 
             # Decode base64url encoded body if present
             if body:
-                import base64
-                body = base64.urlsafe_b64decode(body).decode('utf-8', errors='ignore')
+                body = a2b_base64(body.replace('-', '+').replace('_', '/') + '==').decode('utf-8', errors='ignore')
 
             # Create action file content
-            content = f"""---
-type: email
-from: {headers.get('From', 'Unknown')}
-subject: {headers.get('Subject', 'No Subject')}
-received: {datetime.now().isoformat()}
-priority: high
-status: pending
----
-
-# Email Content
-
-{body}
-
-# Suggested Actions
-
-- [ ] Review email content
-- [ ] Determine appropriate response
-- [ ] Draft reply if needed
-- [ ] Take required action based on email content
-- [ ] Move to appropriate folder after processing
-
-# Email Details
-
-**From:** {headers.get('From', 'Unknown')}
-**Subject:** {headers.get('Subject', 'No Subject')}
-**Date:** {headers.get('Date', 'Unknown')}
-**Message ID:** {message['id']}
-
-# Quick Actions
-
-- [ ] Mark as read
-- [ ] Archive after processing
-- [ ] Forward to relevant party if needed
-- [ ] Create calendar event if it's a meeting request
-
----
-*Generated by Gmail Watcher*
-"""
+            sender = headers.get('From', 'Unknown')
+            subject = headers.get('Subject', 'No Subject')
+            content = render_action_file({
+                'sender': sender,
+                'subject': subject,
+                'received': datetime.now().isoformat(),
+                'body': body,
+                'date': headers.get('Date', 'Unknown'),
+                'message_id': message['id']
+            })
 
             # Create file path
             filepath = self.needs_action / f'EMAIL_{message['id']}.md'
 
             # Write the file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            filepath.write_text(content, encoding='utf-8')
 
             # Mark email as processed
             self.processed_ids.add(message['id'])
 
-            # Save processed IDs
-            processed_file = Path(self.vault_path) / 'processed_emails.txt'
-            with open(processed_file, 'w') as f:
-                f.write('\n'.join(self.processed_ids))
+            # Save processed ID (append only the new entry)
+            with open(self.processed_file, 'a', encoding='utf-8') as f:
+                f.write(message['id'] + '\n')
 
             # Log to audit logger
             self.audit_logger.log_watcher_event(
                 watcher_name='GmailWatcher',
                 event_type='email_received',
                 event_data={
-                    'from': headers.get('From', 'Unknown'),
-                    'subject': headers.get('Subject', 'No Subject'),
+                    'from': sender,
+                    'subject': subject,
                     'message_id': message['id']
                 },
                 action_file_created=str(filepath)
             )
 
-            self.logger.info(f'Created action file for email: {headers.get("Subject", "No Subject")}')
+            self.logger.info('Created action file for email: %s', subject)
             return filepath
 
         except Exception as e:
-            self.logger.error(f'Error creating action file for email {message.get("id", "unknown")}: {e}')
+            self.logger.error('Error creating action file for email %s: %s', message.get('id', 'unknown'), e)
             return Path('')
 
 if __name__ == "__main__":
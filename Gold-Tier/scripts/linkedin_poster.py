@@ -4,12 +4,32 @@ LinkedIn Poster - Automatically posts business content on LinkedIn to generate s
 Creates and posts professional content on LinkedIn based on business goals and analytics.
 """
 
+import os
+import sys
 import time
+import functools
+import signal
 import logging
 import random
+import threading
 from pathlib import Path
-from playwright.sync_api import sync_playwright
 from datetime import datetime, timedelta
+from base_watcher import atomic_write_text, get_banner_logger
+
+@functools.cache
+def _find_chrome() -> str:
+    """Locate the installed Chrome executable once per process."""
+    chrome_paths = [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
+    ]
+
+    for path in chrome_paths:
+        if os.path.exists(path):
+            return path
+
+    return "chrome"
 
 class LinkedInPoster:
     def __init__(self, session_path: str, vault_path: str, post_interval: int = 86400):
@@ -27,6 +47,9 @@ class LinkedInPoster:
         self.last_post_time = None
         self.post_templates = self._load_post_templates()
 
+        # Set to stop the posting loop; run() waits on it between checks
+        self._stop = threading.Event()
+
         # Set up logging
         self.logger = logging.getLogger('LinkedInPoster')
         logging.basicConfig(
@@ -38,10 +61,13 @@ class LinkedInPoster:
             ]
         )
 
+        # Console status banners
+        self.banner = get_banner_logger('LinkedInPoster')
+
         # Load last post time
         self._load_last_post_time()
 
-        self.logger.info(f'LinkedInPoster initialized')
+        self.logger.info('LinkedInPoster initialized')
 
     def _load_post_templates(self):
         """Load LinkedIn post templates from vault."""
@@ -105,8 +131,13 @@ class LinkedInPoster:
             }
         ]
 
-    def _cleanup_session(self):
-        """Clean up locked session files"""
+    def _cleanup_session(self, force: bool = False):
+        """
+        Clean up locked session files.
+
+        Args:
+            force (bool): Also delete Chrome's cache directories (only after a failed launch)
+        """
         import shutil
         try:
             session_dir = Path(self.session_path)
@@ -118,7 +149,10 @@ class LinkedInPoster:
                     except:
                         pass
                 
-                # Remove cache directories
+                # Caches are kept so pages load from disk; only wiped when the profile looks broken
+                if not force:
+                    return
+
                 for cache_dir in ['GPUCache', 'Code Cache', 'Shared Cache', 'ShaderCache']:
                     cache_path = session_dir / cache_dir
                     if cache_path.exists():
@@ -131,27 +165,13 @@ class LinkedInPoster:
 
     def _init_browser(self):
         """Initialize browser for LinkedIn"""
-        import os
         from playwright.sync_api import sync_playwright
         
         # Cleanup session first
         self._cleanup_session()
         time.sleep(2)
         
-        chrome_paths = [
-            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-            os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
-        ]
-
-        chrome_executable = None
-        for path in chrome_paths:
-            if os.path.exists(path):
-                chrome_executable = path
-                break
-
-        if not chrome_executable:
-            chrome_executable = "chrome"
+        chrome_executable = _find_chrome()
 
         playwright = sync_playwright().start()
         
@@ -175,7 +195,8 @@ class LinkedInPoster:
             page = browser.pages[0] if browser.pages else browser.new_page()
             return playwright, browser, page
         except Exception as e:
-            self.logger.debug(f'Persistent context failed: {e}')
+            self.logger.debug('Persistent context failed: %s', e)
+            self._cleanup_session(force=True)
             # Fallback to regular browser
             browser = playwright.chromium.launch(
                 headless=False,
@@ -203,9 +224,9 @@ class LinkedInPoster:
 
     def _save_last_post_time(self):
         """Save the last post time to file."""
+        self.last_post_time = datetime.now()
         post_time_file = self.vault_path / 'last_linkedin_post.txt'
-        with open(post_time_file, 'w') as f:
-            f.write(datetime.now().isoformat())
+        atomic_write_text(post_time_file, self.last_post_time.isoformat())
 
     def should_post(self) -> bool:
         """Check if it's time to post."""
@@ -377,13 +398,13 @@ created: {datetime.now().isoformat()}
             with open(post_file, 'w', encoding='utf-8') as f:
                 f.write(post_content)
             
-            self.logger.info(f'Post saved to: {post_file.name}')
+            self.logger.info('Post saved to: %s', post_file.name)
             self._save_last_post_time()
             
             return {'success': True, 'content': content, 'file': str(post_file)}
 
         except Exception as e:
-            self.logger.error(f'Error creating post file: {e}')
+            self.logger.error('Error creating post file: %s', e)
             return {'success': False, 'error': str(e)}
 
     def _add_post_formatting(self, content_box):
@@ -395,81 +416,78 @@ created: {datetime.now().isoformat()}
         # Add some basic formatting
         content_box.fill(f"{emoji} {content_box.text_content()} {emoji}")
 
+    def _seconds_until_next_post(self) -> float:
+        """Seconds to sleep until the next post is due (at least one minute)."""
+        if not self.last_post_time:
+            return 3600
+        next_post_time = self.last_post_time + timedelta(seconds=self.post_interval)
+        return max(60, (next_post_time - datetime.now()).total_seconds())
+
+    def stop(self):
+        """Wake the posting loop and make it exit."""
+        self._stop.set()
+
     def run(self):
         """Main posting loop."""
-        while True:
-            try:
-                if self.should_post():
-                    # Generate post content
-                    post_data = self.generate_post_content()
-                    
-                    print(f"\n{'='*60}")
-                    print(f"  GENERATING NEW POST")
-                    print(f"{'='*60}")
-                    print(f"  Template: {post_data['template']}")
-                    print(f"  Category: {post_data['category']}")
-                    print(f"{'='*60}\n")
-                    
-                    self.logger.info(f'Generating post: {post_data["template"]} ({post_data["category"]})')
-
-                    # Create the post
-                    result = self.create_post(post_data['content'])
-
-                    if result['success']:
-                        print(f"\n{'='*60}")
-                        print(f"  POST CREATED SUCCESSFULLY!")
-                        print(f"{'='*60}")
-                        print(f"  File: {result['file']}")
-                        print(f"  Content: {result['content'][:80]}...")
-                        print(f"\n  Next Steps:")
-                        print(f"   1. Review the post in Needs_Action folder")
-                        print(f"   2. Edit if needed")
-                        print(f"   3. Post manually on LinkedIn")
-                        print(f"{'='*60}\n")
-                        
-                        self.logger.info(f'Post created successfully: {result["content"][:50]}...')
+        # Ctrl+C wakes the wait below immediately instead of after the next check;
+        # the previous handler is put back when the loop exits
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, lambda *_: self.stop())
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    if self.should_post():
+                        # Generate post content
+                        post_data = self.generate_post_content()
+
+                        self.banner.info('GENERATING NEW POST\nTemplate: %s\nCategory: %s',
+                                         post_data['template'], post_data['category'])
+                        self.logger.info('Generating post: %s (%s)', post_data['template'], post_data['category'])
+
+                        # Create the post
+                        result = self.create_post(post_data['content'])
+
+                        if result['success']:
+                            self.banner.info(
+                                'POST CREATED SUCCESSFULLY!\nFile: %s\nContent: %s...\n\nNext Steps:\n'
+                                ' 1. Review the post in Needs_Action folder\n 2. Edit if needed\n 3. Post manually on LinkedIn',
+                                result['file'], result['content'][:80])
+                            self.logger.info('Post created successfully: %s...', result['content'][:50])
+                        else:
+                            self.banner.info('POST FAILED\nError: %s', result.get('error', 'Unknown error'))
+                            self.logger.error('Failed to create post: %s', result['error'])
                     else:
-                        print(f"\n{'='*60}")
-                        print(f"  POST FAILED")
-                        print(f"{'='*60}")
-                        print(f"  Error: {result.get('error', 'Unknown error')}")
-                        print(f"{'='*60}\n")
-                        
-                        self.logger.error(f'Failed to create post: {result["error"]}')
-                else:
-                    # Calculate time until next post
-                    time_since_last = datetime.now() - self.last_post_time
-                    hours_since = time_since_last.total_seconds() / 3600
-                    hours_until = 24 - hours_since
-                    
-                    print(f"\n{'='*60}")
-                    print(f"  No new post needed yet")
-                    print(f"{'='*60}")
-                    print(f"  Last post: {hours_since:.1f} hours ago")
-                    print(f"  Next post in: {hours_until:.1f} hours")
-                    print(f"{'='*60}\n")
-                    
-                    self.logger.info(f'Not time to post yet. Last post: {hours_since:.1f}h ago')
-
-                # Wait before next check
-                print(f"  Checking again in 1 hour...")
-                print(f"  (Press Ctrl+C to stop)\n")
-                time.sleep(3600)  # Check every hour
-
-            except KeyboardInterrupt:
-                print(f"\n{'='*60}")
-                print(f"  LINKEDIN POSTER STOPPED")
-                print(f"{'='*60}\n")
-                self.logger.info('LinkedIn poster stopped')
-                break
-
-            except Exception as e:
-                self.logger.error(f'Error in posting loop: {e}')
-                time.sleep(3600)  # Wait before retrying
+                        # Calculate time until next post
+                        now = datetime.now()
+                        hours_since = (now - self.last_post_time).total_seconds() / 3600
+                        hours_until = self.post_interval / 3600 - hours_since
+
+                        self.banner.info('No new post needed yet\nLast post: %.1f hours ago\nNext post in: %.1f hours',
+                                         hours_since, hours_until)
+                        self.logger.info('Not time to post yet. Last post: %.1fh ago', hours_since)
+
+                    # Sleep until the next post is due
+                    delay = self._seconds_until_next_post()
+                    sys.stdout.write(f"  Checking again in {delay / 3600:.1f} hours...\n  (Press Ctrl+C to stop)\n\n")
+                    sys.stdout.flush()
+                    self._stop.wait(delay)
+
+                except KeyboardInterrupt:
+                    break
+
+                except Exception as e:
+                    self.logger.error('Error in posting loop: %s', e)
+                    self._stop.wait(3600)  # Wait before retrying
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+
+        self.banner.info('LINKEDIN POSTER STOPPED')
+        self.logger.info('LinkedIn poster stopped')
 
 if __name__ == "__main__":
-    import sys
-    
     # Set UTF-8 encoding for Windows console
     if sys.platform == 'win32':
         sys.stdout.reconfigure(encoding='utf-8')
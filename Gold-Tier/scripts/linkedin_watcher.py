@@ -5,18 +5,379 @@ Triggers when new LinkedIn activities occur and creates action files for the AI
 Integrates with approval workflow and business context analysis.
 """
 
+import re
 import time
+import asyncio
 import logging
 import json
+import hashlib
+import itertools
 import random
 import shutil
 import os
 from pathlib import Path
-from playwright.sync_api import sync_playwright
-from base_watcher import BaseWatcher
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from base_watcher import BaseWatcher, atomic_write_lines, get_banner_logger
 from datetime import datetime, timedelta
-from enhanced_approval_workflow import EnhancedApprovalWorkflow
-from linkedin_poster import LinkedInPoster
+
+# Notification categories as (pattern, category); matched case-insensitively in the page, first match wins
+NOTIFICATION_CATEGORIES = [
+    (r'accepted your (?:connection )?invitation|is now connected with you|joined your network', 'connection_accepted'),
+    (r'congratulate|work anniversary|new position', 'congratulations'),
+    (r'reacted to|liked your|commented on|mentioned you|others reacted|reactions|comments on your', 'engagement'),
+    (r'viewed your profile', 'profile_view'),
+]
+
+# Python-side copy of the categories for notifications that come from the API rather than the page
+_CATEGORY_RES = [(re.compile(pattern, re.I), category) for pattern, category in NOTIFICATION_CATEGORIES]
+
+def notification_id(text: str) -> str:
+    """ID of a notification, derived from its text so the same notification maps to the same ID."""
+    return f"NOTIF_{hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()}"
+
+def _classify_notification(text: str):
+    """Classify one notification text the same way CLASSIFY_NOTIFICATIONS_JS does."""
+    text = ' '.join(text.split())
+    if len(text) < 10:
+        return None
+    category = next((category for pattern, category in _CATEGORY_RES if pattern.search(text)), 'general')
+    return {'text': text, 'category': category}
+
+# LinkedIn's JSON endpoint behind the notifications page
+VOYAGER_NOTIFICATIONS_URL = 'https://www.linkedin.com/voyager/api/voyagerIdentityDashNotificationCards?q=filterVanityName&count=15'
+
+# Item fields and console label for each category ('general' is the unmatched fallback)
+NOTIFICATION_KINDS = {
+    'connection_accepted': ('connection_accepted', 'Connection Accepted', 0.8, '🤝 Connection accepted!'),
+    'congratulations': ('notification', 'Congratulations', 0.5, '🎉 Congratulations:'),
+    'engagement': ('notification', 'Engagement', 0.6, '💬 Engagement:'),
+    'profile_view': ('notification', 'Profile View', 0.4, '👁️ Profile view:'),
+    'general': ('notification', 'General', 0.4, '📌 Notification:'),
+}
+
+# Relevance keywords; each distinct keyword found adds to the score once. Single words are
+# looked up in the text's word set by their inflected forms, the few multi-word phrases with a regex.
+WORD_RE = re.compile(r'[a-z]+')
+
+def keyword_forms(keywords) -> MappingProxyType:
+    """Map each keyword and its plural/-ed/-ing/-er forms to the keyword, e.g. 'posted' -> 'post'."""
+    forms = {}
+    for keyword in keywords:
+        stem = keyword[:-1] if keyword.endswith('e') else keyword
+        variants = [keyword, keyword + 's', keyword + 'es', stem + 'ed', stem + 'ing', stem + 'er', stem + 'ers']
+        if keyword.endswith('y'):
+            variants.append(keyword[:-1] + 'ies')
+        for form in variants:
+            forms.setdefault(form, keyword)
+    return MappingProxyType(forms)
+
+def matched_keywords(words: set, forms: MappingProxyType) -> set:
+    """Distinct keywords whose forms appear in words."""
+    return {forms[word] for word in words & forms.keys()}
+
+HIGH_VALUE_WORDS = keyword_forms((
+    'hiring', 'position', 'interview', 'partnership', 'collaboration', 'investment', 'client',
+    'project', 'contract', 'proposal', 'business', 'revenue', 'sales', 'lead', 'prospect'
+))
+HIGH_VALUE_PHRASE_RE = re.compile(r'job opportunit(?=y|ies)')
+MEDIUM_VALUE_WORDS = keyword_forms((
+    'connection', 'network', 'industry', 'professional', 'skill', 'certification', 'course',
+    'learning', 'article', 'post', 'comment', 'mention'
+))
+HIGH_VALUE_CONNECTION_WORDS = keyword_forms((
+    'ceo', 'founder', 'director', 'manager', 'executive', 'investor', 'venture', 'capital',
+    'partner', 'vp', 'chief'
+))
+HIGH_VALUE_CONNECTION_PHRASE_RE = re.compile(r'head of|vice president')
+URGENT_RE = re.compile(r'urgent|asap|immediate|deadline|today', re.I)
+RELEVANT_INDUSTRY_WORDS = keyword_forms((
+    'technology', 'software', 'finance', 'consulting', 'marketing', 'sales', 'healthcare', 'education'
+))
+
+# Default business context; read-only so every watcher can share the same mapping
+BUSINESS_CONTEXT = MappingProxyType({
+    'company_name': 'Your Company Name',
+    'industry': 'Technology',
+    'target_audience': 'Business Professionals',
+    'key_products': ('AI Solutions', 'Business Automation'),
+    'value_proposition': 'Innovative solutions for business growth'
+})
+
+# Bounds for the long-running watcher's in-memory state
+MAX_POST_QUEUE = 1000
+MAX_REMEMBERED_IDS = 10000
+
+# An ID log is rewritten with just the remembered IDs once it holds this many lines
+ID_LOG_COMPACT_LINES = 2 * MAX_REMEMBERED_IDS
+
+# Accept button on each pending invitation card on My Network
+ACCEPT_BUTTON_SELECTOR = 'button:has-text("Accept")'
+
+# Given the matched Accept buttons, return their count and the text of the first one's card
+# (nearest invitation-card div or list item, else the button's parent) in one round trip
+SUMMARIZE_ACCEPT_BUTTONS_JS = """buttons => {
+    if (!buttons.length) return {count: 0, text: ''};
+    const card = buttons[0].closest('div[class*="invitation-card"], li') || buttons[0].parentElement;
+    const text = card ? (card.innerText || card.textContent || '') : '';
+    return {count: buttons.length, text: text.trim()};
+}"""
+
+# Chrome's HTTP cache size (512 MB) - enough to keep LinkedIn's static assets between checks
+DISK_CACHE_SIZE = 512 * 1024 * 1024
+
+# My Network invitation badge, any of LinkedIn's known markups (one compound CSS selector);
+# :visible skips hidden matches earlier in the document, which wait_for_selector would stop at
+INVITATION_BADGE_SELECTOR = ', '.join(f'{selector}:visible' for selector in [
+    'button[aria-label*="invitation"] span[aria-hidden="true"]',
+    'button[aria-label*="Invitation"] span[aria-hidden="true"]',
+    '[data-test="invitations-badge"]',
+    'span.mynetwork-nav__badge',
+    'nav[aria-label*="My Network"] span[aria-hidden="true"]',
+])
+
+# Bell-icon badge, any of LinkedIn's known markups (one compound CSS selector)
+NOTIFICATION_BADGE_SELECTOR = ', '.join([
+    'button[aria-label*="notification"] span[aria-hidden="true"]',
+    'div.notifications-nav__button span.notification-badge',
+    'button.lit-navicon__notification-button span',
+    '[data-test="notifications-badge"]',
+    'span.legacy-navicon__notification-count',
+    'nav[aria-label*="Notifications"] span[aria-hidden="true"]',
+])
+
+# Container that holds the notification items once the page has rendered them
+NOTIFICATION_LIST_SELECTOR = 'ul.scaffold-layout__list, div.notification-items-list-container, section[aria-label*="notification"], [role="list"]'
+
+# Notification item markups, most specific first
+NOTIFICATION_ITEM_SELECTORS = [
+    'ul.scaffold-layout__list > li',
+    'ul.scaffold-layout__list li',
+    '[role="list"] > li',
+    '[role="list"] > div',
+    'div.notification-item',
+    'li.notification-item',
+    '[data-test="notification-item"]',
+    'div.mb2',  # LinkedIn common class
+]
+
+# Uses the first item selector that matches anything and returns it with {text, category}
+# for its first 15 visible elements, whitespace collapsed and items under 10 characters dropped
+CLASSIFY_NOTIFICATIONS_JS = """({selectors, categories}) => {
+    const cats = categories.map(([pattern, category]) => [new RegExp(pattern, 'i'), category]);
+    for (const sel of selectors) {
+        const nodes = document.querySelectorAll(sel);
+        if (!nodes.length) continue;
+        const items = Array.from(nodes)
+            .slice(0, 15)
+            .filter(e => e.getClientRects().length > 0)
+            .map(e => (e.textContent || '').replace(/\\s+/g, ' ').trim())
+            .filter(t => t.length >= 10)
+            .map(t => {
+                const match = cats.find(([re]) => re.test(t));
+                return {text: t, category: match ? match[1] : 'general'};
+            });
+        return {selector: sel, items};
+    }
+    return {selector: null, items: []};
+}"""
+
+# Processed-ID collection (attribute name) for each item type
+PROCESSED_IDS_ATTR = {
+    'notification': 'processed_notifications',
+    'connection_accepted': 'processed_notifications',
+    'connection_request': 'processed_requests',
+    'business_post': 'processed_posts'
+}
+
+# Console banner pieces
+TYPE_EMOJI = {
+    'notification': '🔔',
+    'connection_accepted': '✅',
+    'connection_request': '🤝',
+    'business_post': '📝'
+}
+BANNER_RULE = '=' * 60
+
+# Action file templates, rendered with str.format
+
+# Action file for a LinkedIn notification
+NOTIFICATION_FILE_TEMPLATE = """---
+type: linkedin_notification
+source: linkedin
+id: {id}
+text: {text}
+time: {time}
+notification_type: {notification_type}
+status: pending
+relevance: {relevance}
+---
+
+# LinkedIn Notification
+
+**Type:** {notification_type}
+**Time:** {time}
+
+## Notification Details
+
+**Text:** {text}
+
+## Suggested Actions
+
+- [ ] Review notification content
+- [ ] Determine appropriate response
+- [ ] Take required action based on notification
+- [ ] Move to appropriate folder after processing
+
+## Common Notification Types
+
+- **Job Updates:** Review new job postings or updates
+- **Connection Updates:** Check connection status changes
+- **Company Updates:** Review company news and updates
+- [ ] Reply or engage with content if appropriate
+- [ ] Archive notification after processing
+
+---
+*Generated by LinkedIn Watcher*
+"""
+
+# Action file for an accepted connection
+CONNECTION_ACCEPTED_FILE_TEMPLATE = """---
+type: linkedin_connection_accepted
+source: linkedin
+id: {id}
+text: {text}
+time: {time}
+status: pending
+relevance: {relevance}
+---
+
+# LinkedIn Connection Accepted ✅
+
+**Notification:** {text}
+**Time:** {time}
+**Relevance Score:** {relevance:.1%}
+
+## What Happened
+
+Someone accepted your connection request on LinkedIn.
+
+## Suggested Actions
+
+- [ ] Review the new connection's profile
+- [ ] Send a personalized thank you message
+- [ ] Note any business opportunities
+- [ ] Add to CRM or contact management system
+- [ ] Engage with their recent posts
+- [ ] Schedule follow-up if relevant
+
+## Networking Best Practices
+
+1. **Personalize:** Send a custom message within 24 hours
+2. **Research:** Review their profile for common interests
+3. **Engage:** Like or comment on their recent posts
+4. **Follow-up:** Schedule a call if there's business potential
+
+---
+*Generated by LinkedIn Watcher*
+"""
+
+# Action file for a generated business post
+BUSINESS_POST_FILE_TEMPLATE = """---
+type: linkedin_business_post
+source: linkedin
+id: {id}
+template: {template}
+category: {category}
+status: pending
+relevance: {relevance}
+---
+
+# LinkedIn Business Post
+
+**Template:** {template}
+**Category:** {category}
+**Relevance Score:** {relevance}
+
+## Post Content
+
+{content}
+
+## Suggested Actions
+
+- [ ] Review post content
+- [ ] Check for any errors or improvements
+- [ ] Approve for posting
+- [ ] Schedule post for optimal time
+- [ ] Monitor engagement after posting
+
+## Posting Guidelines
+
+1. **Professional Tone:** Ensure content is professional and engaging
+2. **Relevant Hashtags:** Add 3-5 relevant hashtags
+3. **Timing:** Post during business hours (9 AM - 5 PM)
+4. **Engagement:** Respond to comments within 24 hours
+
+## Approval Required
+
+This post requires human approval before publishing.
+
+---
+*Generated by LinkedIn Watcher*
+"""
+
+# Action file for a pending connection request
+CONNECTION_REQUEST_FILE_TEMPLATE = """---
+type: linkedin_connection_request
+source: linkedin
+id: {id}
+name: {name}
+headline: {headline}
+mutual_connections: {mutual}
+status: pending
+relevance: {relevance}
+---
+
+# LinkedIn Connection Request
+
+**From:** {name}
+**Headline:** {headline}
+**Mutual Connections:** {mutual}
+**Relevance Score:** {relevance}
+
+## Connection Request Details
+
+A new connection request has been received. Review the profile and decide whether to accept or ignore.
+
+## Suggested Actions
+
+- [ ] Review the person's profile
+- [ ] Check mutual connections
+- [ ] Evaluate relevance to your network
+- [ ] Decide whether to accept or ignore
+
+## Decision Options
+
+### Accept Connection
+- [ ] Review their profile and experience
+- [ ] Check if they're in your industry
+- [ ] Evaluate potential mutual benefits
+- [ ] Send personalized acceptance message
+
+### Ignore Request
+- [ ] If not relevant to your network
+- [ ] If spam or irrelevant connection
+- [ ] If you don't know the person
+
+## Profile Information
+
+**Name:** {name}
+**Headline:** {headline}
+**Mutual Connections:** {mutual}
+
+---
+*Generated by LinkedIn Watcher*
+"""
 
 class LinkedInWatcher(BaseWatcher):
     def __init__(self, vault_path: str, session_path: str, check_interval: int = 300):
@@ -31,35 +392,78 @@ class LinkedInWatcher(BaseWatcher):
         super().__init__(vault_path, check_interval)
 
         self.session_path = session_path
-        self.processed_notifications = set()
-        self.processed_requests = set()
+        # Most recently processed IDs, oldest first (bounded to MAX_REMEMBERED_IDS)
+        self.processed_notifications = OrderedDict()
+        self.processed_requests = OrderedDict()
         self.processed_posts = set()
-        self.post_queue = []
 
-        # Approval workflow integration
-        self.approval_workflow = EnhancedApprovalWorkflow()
+        # Vault file contents keyed by path, reused until the file's mtime changes
+        self._file_cache = {}
 
-        # LinkedIn poster
-        self.poster = LinkedInPoster(session_path, vault_path, post_interval=86400)
+        # IDs processed since the last save, appended to the ID files on save
+        self._new_notification_ids = []
+        self._new_request_ids = []
+        # Lines in each ID log, so a log is compacted once appends push it past ID_LOG_COMPACT_LINES
+        self._id_log_lines = {}
+
+        # Sequence number for connection-request IDs (unique even within one clock tick)
+        self._req_seq = itertools.count()
+        self.post_queue = deque(maxlen=MAX_POST_QUEUE)
+
+        # Approval workflow and LinkedIn poster, created on first use (see properties below)
+        self._approval_workflow = None
+        self._poster = None
 
         # Business context integration
         self.business_context = self._load_business_context()
 
         # Set up logging
         self.logger = logging.getLogger('LinkedInWatcher')
+
+        # Console status banners (one write each)
+        self.banner = get_banner_logger('LinkedInWatcher')
         
-        # Browser management
+        # Browser management (async Playwright objects live on this loop across checks)
+        self._loop = asyncio.new_event_loop()
         self.playwright = None
         self.browser = None
         self.page = None
+        self.network_page = None
+
+        # Accept-button locator for the page URL it was built on, reused across checks
+        self._accept_locator = None
+        self._accept_page_url = None
 
         # Load previously processed IDs
         self._load_processed_ids()
 
         self.logger.info(f'LinkedInWatcher initialized with business context integration')
 
-    def _cleanup_session(self):
-        """Clean up locked session files"""
+    @property
+    def approval_workflow(self):
+        """Approval workflow integration, imported and created on first use."""
+        if self._approval_workflow is None:
+            from enhanced_approval_workflow import EnhancedApprovalWorkflow
+            self._approval_workflow = EnhancedApprovalWorkflow()
+        return self._approval_workflow
+
+    @property
+    def poster(self):
+        """LinkedIn poster, imported and created on first use."""
+        # Only used to generate post content, so it never launches its own Chrome on our
+        # profile; our async context can't be handed to its sync API.
+        if self._poster is None:
+            from linkedin_poster import LinkedInPoster
+            self._poster = LinkedInPoster(self.session_path, str(self.vault_path), post_interval=86400)
+        return self._poster
+
+    def _cleanup_session(self, force: bool = False):
+        """
+        Clean up locked session files.
+
+        Args:
+            force (bool): Also delete Chrome's cache directories (only after a failed launch)
+        """
         try:
             session_dir = Path(self.session_path)
             if session_dir.exists():
@@ -71,7 +475,10 @@ class LinkedInWatcher(BaseWatcher):
                     except Exception as e:
                         self.logger.debug(f'Could not remove lock file: {e}')
                 
-                # Remove cache directories
+                # Caches are kept so pages load from disk; only wiped when the profile looks broken
+                if not force:
+                    return
+
                 for cache_dir in ['GPUCache', 'Code Cache', 'Shared Cache', 'ShaderCache']:
                     cache_path = session_dir / cache_dir
                     if cache_path.exists():
@@ -83,27 +490,29 @@ class LinkedInWatcher(BaseWatcher):
         except Exception as e:
             self.logger.debug(f'Session cleanup error: {e}')
 
-    def _init_browser(self):
+    async def _init_browser(self):
         """Initialize browser using system Chrome"""
+        from playwright.async_api import async_playwright
+
         if self.browser and self.page:
             try:
-                self.page.title()
+                await self.page.title()
                 self.logger.info('Browser already running')
                 return True
             except:
                 self.logger.info('Browser died, reinitializing...')
                 try:
                     if self.playwright:
-                        self.playwright.stop()
+                        await self.playwright.stop()
                 except:
                     pass
                 self.browser = None
                 self.page = None
+                self.network_page = None
                 self.playwright = None
 
         try:
             self._cleanup_session()
-            time.sleep(2)  # Wait longer for cleanup
 
             chrome_paths = [
                 r"C:\Program Files\Google\Chrome\Application\chrome.exe",
@@ -122,11 +531,14 @@ class LinkedInWatcher(BaseWatcher):
 
             self.logger.info(f'Using Chrome: {chrome_executable}')
 
-            self.playwright = sync_playwright().start()
+            # HTTP cache lives outside the profile so it survives session cleanups and relaunches
+            disk_cache_dir = Path(self.session_path).parent / 'chrome_disk_cache'
+
+            self.playwright = await async_playwright().start()
 
             # Try to launch with persistent context (saves login session)
             try:
-                self.browser = self.playwright.chromium.launch_persistent_context(
+                self.browser = await self.playwright.chromium.launch_persistent_context(
                     self.session_path,
                     executable_path=chrome_executable if os.path.exists(chrome_executable) else None,
                     headless=False,
@@ -138,20 +550,25 @@ class LinkedInWatcher(BaseWatcher):
                         '--disable-features=TranslateUI',
                         '--disable-features=ChromeWhatsNewUI',
                         '--disable-infobars',
+                        '--blink-settings=imagesEnabled=false',
+                        f'--disk-cache-dir={disk_cache_dir}',
+                        f'--disk-cache-size={DISK_CACHE_SIZE}',
                     ],
                     timeout=120000,
                     slow_mo=200
                 )
-                self.page = self.browser.pages[0] if self.browser.pages else self.browser.new_page()
+                self.page = self.browser.pages[0] if self.browser.pages else await self.browser.new_page()
                 self.page.set_default_timeout(90000)
+                await self._open_network_page()
                 self.logger.info('Browser initialized with persistent session')
                 return True
             except Exception as e:
                 self.logger.warning(f'Persistent context failed: {e}')
+                self._cleanup_session(force=True)
                 self.logger.info('Trying regular browser launch...')
                 
                 # Fallback to regular browser
-                self.browser = self.playwright.chromium.launch(
+                self.browser = await self.playwright.chromium.launch(
                     headless=False,
                     executable_path=chrome_executable if os.path.exists(chrome_executable) else None,
                     args=[
@@ -162,10 +579,14 @@ class LinkedInWatcher(BaseWatcher):
                         '--disable-features=TranslateUI',
                         '--disable-features=ChromeWhatsNewUI',
                         '--disable-infobars',
+                        '--blink-settings=imagesEnabled=false',
+                        f'--disk-cache-dir={disk_cache_dir}',
+                        f'--disk-cache-size={DISK_CACHE_SIZE}',
                     ]
                 )
-                self.page = self.browser.new_page()
+                self.page = await self.browser.new_page()
                 self.page.set_default_timeout(90000)
+                await self._open_network_page()
                 self.logger.info('Browser initialized (session will not be saved)')
                 return True
             
@@ -173,60 +594,122 @@ class LinkedInWatcher(BaseWatcher):
             self.logger.error(f'Failed to initialize browser: {e}')
             try:
                 if self.playwright:
-                    self.playwright.stop()
+                    await self.playwright.stop()
             except:
                 pass
             self.browser = None
             self.page = None
             return False
 
+    async def _open_network_page(self):
+        """Open the dedicated My Network tab next to the notifications tab (self.page)."""
+        self.network_page = await self.browser.new_page()
+        self.network_page.set_default_timeout(90000)
+
+    def finish_batch(self):
+        """Append the IDs processed during this check to the ID logs, once per check."""
+        self._save_processed_ids()
+
     def close_browser(self):
         """Close the browser when shutting down"""
+        self._save_processed_ids()
         try:
-            if self.browser:
-                self.browser.close()
-                self.logger.info('Browser closed')
-            if self.playwright:
-                self.playwright.stop()
-                self.logger.info('Playwright stopped')
+            if not self._loop.is_closed():
+                self._loop.run_until_complete(self._close_browser())
             self._cleanup_session()
         except Exception as e:
             self.logger.error(f'Error closing browser: {e}')
 
+    async def _close_browser(self):
+        """Close the browser and stop Playwright on the watcher's event loop."""
+        if self.browser:
+            await self.browser.close()
+            self.logger.info('Browser closed')
+        if self.playwright:
+            await self.playwright.stop()
+            self.logger.info('Playwright stopped')
+        self.browser = None
+        self.page = None
+        self.network_page = None
+        self.playwright = None
+
     def _load_business_context(self):
         """Load business context from vault."""
-        business_context = {
-            'company_name': 'Your Company Name',
-            'industry': 'Technology',
-            'target_audience': 'Business Professionals',
-            'key_products': ['AI Solutions', 'Business Automation'],
-            'value_proposition': 'Innovative solutions for business growth'
-        }
-        return business_context
+        return BUSINESS_CONTEXT
 
     def _load_processed_ids(self):
         """Load previously processed notification and request IDs."""
         notifications_file = Path(self.vault_path) / 'processed_linkedin_notifications.txt'
         requests_file = Path(self.vault_path) / 'processed_linkedin_requests.txt'
 
-        if notifications_file.exists():
-            with open(notifications_file, 'r') as f:
-                self.processed_notifications = set(f.read().splitlines())
-
-        if requests_file.exists():
-            with open(requests_file, 'r') as f:
-                self.processed_requests = set(f.read().splitlines())
+        self.processed_notifications = self._read_id_log(notifications_file)
+        self.processed_requests = self._read_id_log(requests_file)
+
+    def _read_id_log(self, id_file: Path) -> OrderedDict:
+        """Read an append-only ID log, one ID per line, keeping the most recent MAX_REMEMBERED_IDS."""
+        if not id_file.exists():
+            return OrderedDict()
+
+        raw = id_file.read_text(encoding='utf-8')
+        lines = raw.splitlines()
+        ids = OrderedDict.fromkeys(lines)
+        ids.pop('', None)
+
+        while len(ids) > MAX_REMEMBERED_IDS:
+            ids.popitem(last=False)
+
+        # Drop duplicates and forgotten IDs (and fix a missing trailing newline) so the log
+        # stays bounded and appends stay one ID per line
+        if lines and (len(lines) != len(ids) or not raw.endswith('\n')):
+            self._compact_id_log(id_file, ids)
+        else:
+            self._id_log_lines[id_file] = len(lines)
+        return ids
+
+    def _compact_id_log(self, id_file: Path, ids: OrderedDict):
+        """Rewrite an ID log with just the remembered IDs, oldest first."""
+        atomic_write_lines(id_file, ids)
+        self._id_log_lines[id_file] = len(ids)
+
+    @staticmethod
+    def _remember_id(processed: OrderedDict, item_id: str):
+        """Add an ID to a processed-ID map, evicting the oldest once it is full."""
+        processed[item_id] = None
+        if len(processed) > MAX_REMEMBERED_IDS:
+            processed.popitem(last=False)
+
+    def _mark_notification_processed(self, item_id: str):
+        """Record a notification ID; it is appended to disk on the next save."""
+        if item_id not in self.processed_notifications:
+            self._remember_id(self.processed_notifications, item_id)
+            self._new_notification_ids.append(item_id)
+
+    def _mark_request_processed(self, item_id: str):
+        """Record a connection-request ID; it is appended to disk on the next save."""
+        if item_id not in self.processed_requests:
+            self._remember_id(self.processed_requests, item_id)
+            self._new_request_ids.append(item_id)
 
     def _save_processed_ids(self):
-        """Save processed notification and request IDs."""
+        """Append IDs processed since the last save to the ID logs."""
+        # Nothing new since the last save (the common case) - skip the file I/O
+        if not self._new_notification_ids and not self._new_request_ids:
+            return
+
         notifications_file = Path(self.vault_path) / 'processed_linkedin_notifications.txt'
         requests_file = Path(self.vault_path) / 'processed_linkedin_requests.txt'
 
-        with open(notifications_file, 'w') as f:
-            f.write('\n'.join(self.processed_notifications))
-
-        with open(requests_file, 'w') as f:
-            f.write('\n'.join(self.processed_requests))
+        for id_file, new_ids, processed in (
+                (notifications_file, self._new_notification_ids, self.processed_notifications),
+                (requests_file, self._new_request_ids, self.processed_requests)):
+            if new_ids:
+                with open(id_file, 'a', encoding='utf-8') as f:
+                    f.writelines(item_id + '\n' for item_id in new_ids)
+                log_lines = self._id_log_lines.get(id_file, 0) + len(new_ids)
+                self._id_log_lines[id_file] = log_lines
+                new_ids.clear()
+                if log_lines > ID_LOG_COMPACT_LINES:
+                    self._compact_id_log(id_file, processed)
 
     def check_for_updates(self) -> list:
         """
@@ -235,35 +718,23 @@ class LinkedInWatcher(BaseWatcher):
         Returns:
             list: List of new items to process
         """
+        return self._loop.run_until_complete(self._check_for_updates_async())
+
+    async def _check_for_updates_async(self) -> list:
+        """Run the notification and connection-request checks concurrently."""
         # Initialize browser if needed
         if not self.browser or not self.page:
-            if not self._init_browser():
+            if not await self._init_browser():
                 self.logger.error('Failed to initialize browser')
                 return []
 
         try:
-            # Navigate to LinkedIn if not already there
-            if 'linkedin.com' not in self.page.url:
-                self.logger.info('Loading LinkedIn...')
-                try:
-                    self.page.goto('https://www.linkedin.com', wait_until='domcontentloaded', timeout=90000)
-                    time.sleep(5)
-                except Exception as e:
-                    self.logger.error(f'Failed to load LinkedIn: {e}')
-                    return []
-            else:
-                self.logger.info('LinkedIn already loaded')
-
-            # Wait for page to stabilize
-            time.sleep(3)
-
-            self.logger.info('Checking for new notifications...')
-            # Check notifications
-            new_notifications = self._check_notifications(self.page)
-
-            self.logger.info('Checking for connection requests...')
-            # Check connection requests
-            new_requests = self._check_connection_requests(self.page)
+            # Each tab stays on its own page between checks, so both load at the same time
+            self.logger.info('Checking for new notifications and connection requests...')
+            new_notifications, new_requests = await asyncio.gather(
+                self._check_notifications(self.page),
+                self._check_connection_requests(self.network_page)
+            )
 
             # Combine all new items
             new_items = new_notifications + new_requests
@@ -273,17 +744,13 @@ class LinkedInWatcher(BaseWatcher):
                 notif_count = len([n for n in new_items if n['type'] in ['notification', 'connection_accepted']])
                 req_count = len([n for n in new_items if n['type'] == 'connection_request'])
                 
-                print(f"\n{'='*60}")
-                print(f"  📊 LINKEDIN ACTIVITY DETECTED!")
-                print(f"{'='*60}")
-                print(f"     🔔 Notifications: {notif_count}")
-                print(f"     🤝 Connection Requests: {req_count}")
-                print(f"     📝 Total Items: {len(new_items)}")
-                print(f"{'='*60}\n")
+                self.banner.info('📊 LINKEDIN ACTIVITY DETECTED!\n'
+                                 '   🔔 Notifications: %d\n   🤝 Connection Requests: %d\n   📝 Total Items: %d',
+                                 notif_count, req_count, len(new_items))
                 
                 self.logger.info(f'Found {len(new_items)} new LinkedIn items ({notif_count} notifications, {req_count} requests)')
             else:
-                print(f"\n⏳  No new LinkedIn activity (next check: 5 min)")
+                self.banner.info('⏳  No new LinkedIn activity (next check: 5 min)')
                 self.logger.info('No new LinkedIn activity detected')
 
             self.logger.debug(f'Found {len(new_items)} new LinkedIn items')
@@ -294,56 +761,63 @@ class LinkedInWatcher(BaseWatcher):
             self.logger.error(f'Error checking LinkedIn updates: {e}')
             self.browser = None
             self.page = None
+            self.network_page = None
             return []
 
-    def _check_notifications(self, page):
+    async def _check_notifications(self, page):
         """Check for new LinkedIn notifications including accepted connections."""
         new_notifications = []
 
+        # Read notifications from LinkedIn's JSON API when possible - no page render needed
+        try:
+            api_results = await self._fetch_notifications_api()
+        except Exception as e:
+            self.logger.debug(f'Notifications API unavailable: {e}')
+            api_results = None
+
+        if api_results:
+            self.logger.info(f'📋 Found {len(api_results)} notifications via API')
+            return self._build_notifications(api_results)
+
         try:
             # Navigate to notifications page for accurate detection
             try:
-                self.logger.debug('Navigating to notifications page...')
-                page.goto('https://www.linkedin.com/notifications/', wait_until='domcontentloaded', timeout=90000)
-                time.sleep(5)  # Wait for page to load
+                if '/notifications/' in page.url:
+                    self.logger.debug('Reloading notifications page...')
+                    await page.reload(wait_until='domcontentloaded', timeout=90000)
+                else:
+                    self.logger.debug('Navigating to notifications page...')
+                    await page.goto('https://www.linkedin.com/notifications/', wait_until='domcontentloaded', timeout=90000)
             except Exception as e:
                 self.logger.error(f'Failed to navigate to notifications page: {e}')
                 return new_notifications
 
+            # Wait for the notification list to render instead of sleeping a fixed time
+            try:
+                await page.wait_for_selector(NOTIFICATION_LIST_SELECTOR, state='attached', timeout=15000)
+            except:
+                self.logger.debug('Notification list container not found, continuing anyway')
+
             # Method 1: Check notification badge count on bell icon
             try:
-                # Try multiple selector patterns for notification badge
-                badge_selectors = [
-                    'button[aria-label*="notification"] span[aria-hidden="true"]',
-                    'div.notifications-nav__button span.notification-badge',
-                    'button.lit-navicon__notification-button span',
-                    '[data-test="notifications-badge"]',
-                    'span.legacy-navicon__notification-count',
-                    'nav[aria-label*="Notifications"] span[aria-hidden="true"]',
-                ]
-                
-                count_text = None
-                for selector in badge_selectors:
-                    try:
-                        notif_badge = page.locator(selector).first
-                        if notif_badge.is_visible(timeout=3000):
-                            count_text = notif_badge.text_content(timeout=3000).strip()
-                            if count_text:
-                                self.logger.debug(f'Found badge with selector: {selector}, count: {count_text}')
-                                break
-                    except:
-                        continue
+                # One call, no auto-wait: an absent badge returns [] instead of timing out
+                texts = await page.locator(NOTIFICATION_BADGE_SELECTOR).all_inner_texts()
+                count_text = next((t.strip() for t in texts if t.strip()), None)
+                if count_text:
+                    self.logger.debug(f'Found badge count: {count_text}')
 
                 if count_text and count_text.isdigit():
                     notification_count = int(count_text)
 
-                    if notification_count > 0:
-                        notification_id = f"NOTIF_{int(time.time())}"
+                    # Same count -> same ID, so an unchanged badge isn't reported every check
+                    badge_text = f'You have {notification_count} new notifications'
+                    badge_id = notification_id(badge_text)
 
+                    if notification_count > 0 and badge_id not in self.processed_notifications:
                         new_notifications.append({
                             'type': 'notification',
-                            'id': notification_id,
-                            'text': f'You have {notification_count} new notifications',
+                            'id': badge_id,
+                            'text': badge_text,
                             'time': 'Just now',
                             'notification_type': 'General',
                             'relevance': 0.5,
@@ -359,143 +833,18 @@ class LinkedInWatcher(BaseWatcher):
             # Method 2: Parse actual notifications from the notifications page
             try:
                 self.logger.debug('Looking for notification items...')
-                
-                # Wait for notification list to appear
-                try:
-                    page.wait_for_selector('ul.scaffold-layout__list, div.notification-items-list-container, section[aria-label*="notification"], [role="list"]', timeout=15000)
-                    time.sleep(3)
-                except:
-                    self.logger.debug('Notification list container not found, continuing anyway')
-
-                # Try to find notification items with multiple selectors
-                notification_selectors = [
-                    'ul.scaffold-layout__list > li',
-                    'ul.scaffold-layout__list li',
-                    '[role="list"] > li',
-                    '[role="list"] > div',
-                    'div.notification-item',
-                    'li.notification-item',
-                    '[data-test="notification-item"]',
-                    'div.mb2',  # LinkedIn common class
-                ]
-                
-                notif_items = None
-                for selector in notification_selectors:
-                    try:
-                        items = page.locator(selector)
-                        count = items.count()
-                        if count > 0:
-                            self.logger.debug(f'Found {count} items with selector: {selector}')
-                            notif_items = items
-                            break
-                    except:
-                        continue
-
-                if notif_items:
-                    count = min(notif_items.count(), 15)  # Check up to 15 recent notifications
-                    
-                    self.logger.info(f'📋 Found {count} notification items on page')
-                    
-                    for i in range(count):
-                        try:
-                            item = notif_items.nth(i)
-                            if not item.is_visible(timeout=2000):
-                                continue
-                                
-                            # Get full text content from the notification
-                            text = item.text_content(timeout=5000).strip()
-                            
-                            # Clean up the text - remove extra whitespace
-                            text = ' '.join(text.split())
-                            
-                            # Skip empty or very short items
-                            if len(text) < 10:
-                                continue
-                            
-                            self.logger.debug(f'Notification {i}: {text[:150]}')
-
-                            # Check for accepted connection notifications
-                            if 'accepted your connection invitation' in text.lower() or \
-                               'is now connected with you' in text.lower() or \
-                               'joined your network' in text.lower() or \
-                               'accepted your invitation' in text.lower():
-
-                                notification_id = f"ACCEPT_{int(time.time())}_{i}"
-
-                                new_notifications.append({
-                                    'type': 'connection_accepted',
-                                    'id': notification_id,
-                                    'text': text[:200],
-                                    'time': 'Just now',
-                                    'notification_type': 'Connection Accepted',
-                                    'relevance': 0.8,
-                                    'requires_action': True
-                                })
-
-                                self.logger.info(f'🤝 Connection accepted! {text[:50]}')
-                            
-                            # Check for congratulations notifications (work anniversary, new position)
-                            elif 'congratulate' in text.lower() or 'work anniversary' in text.lower() or 'new position' in text.lower():
-                                notification_id = f"CONGRATS_{int(time.time())}_{i}"
-                                new_notifications.append({
-                                    'type': 'notification',
-                                    'id': notification_id,
-                                    'text': text[:200],
-                                    'time': 'Just now',
-                                    'notification_type': 'Congratulations',
-                                    'relevance': 0.5,
-                                    'requires_action': True
-                                })
-                                self.logger.info(f'🎉 Congratulations: {text[:60]}')
-                            
-                            # Check for reactions/engagement notifications
-                            elif any(keyword in text.lower() for keyword in [
-                                'reacted to', 'liked your', 'commented on', 'mentioned you',
-                                'others reacted', 'reactions', 'comments on your'
-                            ]):
-                                notification_id = f"ENGAGE_{int(time.time())}_{i}"
-                                new_notifications.append({
-                                    'type': 'notification',
-                                    'id': notification_id,
-                                    'text': text[:200],
-                                    'time': 'Just now',
-                                    'notification_type': 'Engagement',
-                                    'relevance': 0.6,
-                                    'requires_action': True
-                                })
-                                self.logger.info(f'💬 Engagement: {text[:60]}')
-                            
-                            # Check for profile views
-                            elif 'viewed your profile' in text.lower():
-                                notification_id = f"PROFILE_{int(time.time())}_{i}"
-                                new_notifications.append({
-                                    'type': 'notification',
-                                    'id': notification_id,
-                                    'text': text[:200],
-                                    'time': 'Just now',
-                                    'notification_type': 'Profile View',
-                                    'relevance': 0.4,
-                                    'requires_action': True
-                                })
-                                self.logger.info(f'👁️ Profile view: {text[:60]}')
-                            
-                            # Generic notification fallback
-                            elif len(text) > 30:
-                                notification_id = f"NOTIF_{int(time.time())}_{i}"
-                                new_notifications.append({
-                                    'type': 'notification',
-                                    'id': notification_id,
-                                    'text': text[:200],
-                                    'time': 'Just now',
-                                    'notification_type': 'General',
-                                    'relevance': 0.4,
-                                    'requires_action': True
-                                })
-                                self.logger.info(f'📌 Notification: {text[:60]}')
-                                
-                        except Exception as e:
-                            self.logger.debug(f'Error processing notification {i}: {e}')
-                            continue
+
+                # Find, read and classify the visible items in one round-trip (up to 15 recent notifications)
+                found = await page.evaluate(
+                    CLASSIFY_NOTIFICATIONS_JS,
+                    {'selectors': NOTIFICATION_ITEM_SELECTORS, 'categories': NOTIFICATION_CATEGORIES}
+                )
+                results = found['items']
+
+                if found['selector']:
+                    self.logger.debug(f'Found items with selector: {found["selector"]}')
+                    self.logger.info(f'📋 Found {len(results)} notification items on page')
+                    new_notifications.extend(self._build_notifications(results))
                 else:
                     self.logger.debug('No notification items found on page')
                     
@@ -507,69 +856,117 @@ class LinkedInWatcher(BaseWatcher):
 
         return new_notifications
 
+    async def _fetch_notifications_api(self):
+        """
+        Fetch recent notifications from LinkedIn's voyager API with the browser session's cookies.
+
+        Returns:
+            list: {text, category} dicts like CLASSIFY_NOTIFICATIONS_JS returns, or None if the API is unavailable
+        """
+        # Only a (persistent) BrowserContext shares its cookies with an API request context
+        request_context = getattr(self.browser, 'request', None)
+        if request_context is None:
+            return None
+
+        cookies = await self.browser.cookies('https://www.linkedin.com')
+        csrf_token = next((c['value'].strip('"') for c in cookies if c['name'] == 'JSESSIONID'), None)
+        if not csrf_token:
+            return None
+
+        response = await request_context.get(
+            VOYAGER_NOTIFICATIONS_URL,
+            headers={
+                'csrf-token': csrf_token,
+                'accept': 'application/vnd.linkedin.normalized+json+2.1',
+                'x-restli-protocol-version': '2.0.0'
+            },
+            timeout=30000
+        )
+        if not response.ok:
+            self.logger.debug(f'Notifications API returned {response.status}, falling back to the page')
+            return None
+
+        data = await response.json()
+        results = []
+        for entity in data.get('included', []):
+            headline = entity.get('headline')
+            if isinstance(headline, dict) and headline.get('text'):
+                result = _classify_notification(headline['text'])
+                if result:
+                    results.append(result)
+        return results[:15]
+
+    def _build_notifications(self, results) -> list:
+        """Turn classified {text, category} results into notification items, skipping processed ones."""
+        new_notifications = []
+        seen_ids = set()
+        for i, result in enumerate(results):
+            try:
+                text = result['text']
+                category = result['category']
+
+                # Generic notifications need a bit more text to be worth an action file
+                if category == 'general' and len(text) <= 30:
+                    continue
+                
+                # Same text -> same ID, so notifications already handled are skipped
+                item_id = notification_id(text)
+                if item_id in self.processed_notifications or item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+                
+                self.logger.debug(f'Notification {i}: {text[:150]}')
+
+                item_type, notification_type, relevance, label = NOTIFICATION_KINDS[category]
+                new_notifications.append({
+                    'type': item_type,
+                    'id': item_id,
+                    'text': text[:200],
+                    'time': 'Just now',
+                    'notification_type': notification_type,
+                    'relevance': relevance,
+                    'requires_action': True
+                })
+                self.logger.info(f'{label} {text[:60]}')
+                    
+            except Exception as e:
+                self.logger.debug(f'Error processing notification {i}: {e}')
+                continue
+
+        return new_notifications
+
     def _analyze_business_relevance(self, text: str) -> float:
         """Analyze business relevance of notification text."""
         if not text:
             return 0.0
         
         text_lower = text.lower()
-        
-        # High-value business keywords
-        high_value_keywords = [
-            'job opportunity', 'hiring', 'position', 'interview',
-            'partnership', 'collaboration', 'investment', 'client',
-            'project', 'contract', 'proposal', 'business',
-            'revenue', 'sales', 'lead', 'prospect'
-        ]
-        
-        # Medium-value keywords
-        medium_value_keywords = [
-            'connection', 'network', 'industry', 'professional',
-            'skill', 'certification', 'course', 'learning',
-            'article', 'post', 'comment', 'mention'
-        ]
+        words = set(WORD_RE.findall(text_lower))
         
         # Calculate relevance score
-        score = 0.0
-        for keyword in high_value_keywords:
-            if keyword in text_lower:
-                score += 0.3
-        
-        for keyword in medium_value_keywords:
-            if keyword in text_lower:
-                score += 0.1
+        high_value = len(matched_keywords(words, HIGH_VALUE_WORDS)) + len(set(HIGH_VALUE_PHRASE_RE.findall(text_lower)))
+        score = 0.3 * high_value
+        score += 0.1 * len(matched_keywords(words, MEDIUM_VALUE_WORDS))
         
         # Cap at 1.0
         return min(score, 1.0)
 
     def _analyze_connection_relevance(self, name: str, headline: str, industry: str) -> float:
         """Analyze business relevance of connection request."""
-        score = 0.0
-        
         # Check headline for relevant keywords
         headline_lower = headline.lower() if headline else ''
         industry_lower = industry.lower() if industry else ''
         
-        # High-value connection keywords
-        high_value_keywords = [
-            'ceo', 'founder', 'director', 'manager', 'executive',
-            'investor', 'venture', 'capital', 'partner',
-            'head of', 'vp', 'vice president', 'chief'
-        ]
-        
-        # Industry relevance
-        relevant_industries = [
-            'technology', 'software', 'finance', 'consulting',
-            'marketing', 'sales', 'healthcare', 'education'
-        ]
+        headline_words = set(WORD_RE.findall(headline_lower))
         
-        for keyword in high_value_keywords:
-            if keyword in headline_lower:
-                score += 0.2
+        titles = len(matched_keywords(headline_words, HIGH_VALUE_CONNECTION_WORDS))
+        titles += len(set(HIGH_VALUE_CONNECTION_PHRASE_RE.findall(headline_lower)))
+        score = 0.2 * titles
         
-        for ind in relevant_industries:
-            if ind in industry_lower or ind in headline_lower:
-                score += 0.1
+        # Industry relevance
+        industries = matched_keywords(set(WORD_RE.findall(industry_lower)), RELEVANT_INDUSTRY_WORDS)
+        industries |= matched_keywords(headline_words, RELEVANT_INDUSTRY_WORDS)
+        score += 0.1 * len(industries)
         
         # Check for mutual connections (simplified)
         if 'mutual' in str(name).lower():
@@ -584,16 +981,23 @@ class LinkedInWatcher(BaseWatcher):
             return True
         
         # Check for urgent keywords
-        urgent_keywords = ['urgent', 'asap', 'immediate', 'deadline', 'today']
-        text_lower = text.lower() if text else ''
-        
-        for keyword in urgent_keywords:
-            if keyword in text_lower:
-                return True
+        if text and URGENT_RE.search(text):
+            return True
         
         # For lower relevance, still create action but mark as normal priority
         return relevance >= 0.3
 
+    def _read_cached(self, path: Path) -> str:
+        """Read a vault file, re-reading it only when its mtime changes."""
+        mtime = path.stat().st_mtime
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        content = path.read_text(encoding='utf-8')
+        self._file_cache[path] = (mtime, content)
+        return content
+
     def _generate_business_posts(self) -> list:
         """Generate business-relevant posts based on business goals."""
         new_posts = []
@@ -604,8 +1008,7 @@ class LinkedInWatcher(BaseWatcher):
             if not business_goals_file.exists():
                 return new_posts
             
-            with open(business_goals_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_cached(business_goals_file)
             
             # Generate post based on business goals
             post_id = f"POST_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -613,14 +1016,13 @@ class LinkedInWatcher(BaseWatcher):
             # Check if we should post (based on last post time)
             last_post_file = self.vault_path / 'last_linkedin_post.txt'
             if last_post_file.exists():
-                with open(last_post_file, 'r') as f:
-                    try:
-                        last_post = datetime.fromisoformat(f.read().strip())
-                        hours_since_post = (datetime.now() - last_post).total_seconds() / 3600
-                        if hours_since_post < 24:
-                            return new_posts  # Not time to post yet
-                    except:
-                        pass
+                try:
+                    last_post = datetime.fromisoformat(self._read_cached(last_post_file).strip())
+                    hours_since_post = (datetime.now() - last_post).total_seconds() / 3600
+                    if hours_since_post < 24:
+                        return new_posts  # Not time to post yet
+                except:
+                    pass
             
             # Generate post content
             post_content = self.poster.generate_post_content()
@@ -642,18 +1044,45 @@ class LinkedInWatcher(BaseWatcher):
         
         return new_posts
 
-    def _check_connection_requests(self, page):
+    def _next_request_id(self) -> str:
+        """Unique ID for a connection request found on this check."""
+        return f"REQ_{time.time_ns()}_{next(self._req_seq)}"
+
+    def _accept_buttons(self, page):
+        """Accept-button locator for the page's current URL, built once per URL."""
+        if self._accept_locator is None or page.url != self._accept_page_url:
+            self._accept_locator = page.locator(ACCEPT_BUTTON_SELECTOR)
+            self._accept_page_url = page.url
+        return self._accept_locator
+
+    async def _wait_for_accept_buttons(self, page, timeout: int = 5000):
+        """Wait for the first Accept button to render, or give up after the timeout (no requests)."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await page.wait_for_load_state('domcontentloaded', timeout=8000)
+            await self._accept_buttons(page).first.wait_for(state='visible', timeout=timeout)
+        except PlaywrightTimeoutError:
+            self.logger.debug('No Accept button rendered, continuing anyway')
+
+    async def _check_connection_requests(self, page):
         """Check for new LinkedIn connection requests from the My Network page."""
         new_requests = []
 
         try:
             # Navigate to My Network page - force main page not grow/manage subpages
             try:
-                self.logger.debug('Navigating to My Network page...')
+                if '/mynetwork/' in page.url:
+                    # Tab is already on My Network from the last check - refresh in place
+                    self.logger.debug('Reloading My Network page...')
+                    await page.reload(wait_until='domcontentloaded', timeout=60000)
+                else:
+                    self.logger.debug('Navigating to My Network page...')
+                    # Go to main mynetwork page first
+                    await page.goto('https://www.linkedin.com/mynetwork/', wait_until='domcontentloaded', timeout=60000)
                 
-                # Go to main mynetwork page first
-                page.goto('https://www.linkedin.com/mynetwork/', wait_until='domcontentloaded', timeout=60000)
-                time.sleep(3)
+                # LinkedIn never goes network-idle (beacons, long polling); wait for the cards instead
+                await self._wait_for_accept_buttons(page)
                 
                 # Check current URL
                 current_url = page.url
@@ -663,16 +1092,16 @@ class LinkedInWatcher(BaseWatcher):
                 if '/grow/' in current_url or '/manage/' in current_url:
                     self.logger.debug('LinkedIn redirected to sub-page, using go_back()...')
                     # Try going back
-                    page.go_back(timeout=30000)
-                    time.sleep(3)
+                    await page.go_back(timeout=30000)
+                    await self._wait_for_accept_buttons(page)
                     
                     # If still on wrong page, navigate directly again
                     current_url = page.url
                     if '/grow/' in current_url or '/manage/' in current_url:
                         self.logger.debug('go_back() did not work, navigating to invitations page directly...')
                         # Navigate to the invitations management page
-                        page.goto('https://www.linkedin.com/mynetwork/invitation-manager/', wait_until='domcontentloaded', timeout=60000)
-                        time.sleep(5)
+                        await page.goto('https://www.linkedin.com/mynetwork/invitation-manager/', wait_until='domcontentloaded', timeout=60000)
+                        await self._wait_for_accept_buttons(page)
                 
             except Exception as e:
                 self.logger.error(f'Failed to navigate to My Network page: {e}')
@@ -682,29 +1111,20 @@ class LinkedInWatcher(BaseWatcher):
             try:
                 self.logger.debug('Searching for Accept buttons...')
                 
-                # Wait for page to fully load
-                try:
-                    page.wait_for_load_state('networkidle', timeout=15000)
-                    time.sleep(2)
-                except:
-                    self.logger.debug('Network idle timeout, continuing anyway')
-                
-                # Find all "Accept" buttons - each one is a connection request
-                accept_buttons = page.locator('button:has-text("Accept")')
-                accept_count = accept_buttons.count()
+                # Find all "Accept" buttons - each one is a connection request - and the first
+                # request's card text, in a single evaluate
+                summary = await self._accept_buttons(page).evaluate_all(SUMMARIZE_ACCEPT_BUTTONS_JS)
+                accept_count = summary['count']
                 
                 if accept_count > 0:
                     self.logger.info(f'🤝 Found {accept_count} pending connection request(s) via Accept buttons')
                     
                     # Get details from first request
                     try:
-                        first_button = accept_buttons.first
-                        # Navigate up to find the card containing this button
-                        parent = first_button.locator('xpath=ancestor::div[contains(@class, "invitation-card")] | xpath=ancestor::li | xpath=..')
-                        text = parent.text_content(timeout=3000).strip()
+                        text = summary['text']
                         name = text.split('\n')[0].strip() if '\n' in text else text[:50]
                         
-                        request_id = f"REQ_{int(time.time())}"
+                        request_id = self._next_request_id()
                         new_requests.append({
                             'type': 'connection_request',
                             'id': request_id,
@@ -718,7 +1138,7 @@ class LinkedInWatcher(BaseWatcher):
                         self.logger.info(f'🤝 Connection request from: {name[:40] if name else "Unknown"}')
                     except Exception as e:
                         self.logger.debug(f'Could not get request details: {e}')
-                        request_id = f"REQ_{int(time.time())}"
+                        request_id = self._next_request_id()
                         new_requests.append({
                             'type': 'connection_request',
                             'id': request_id,
@@ -737,30 +1157,21 @@ class LinkedInWatcher(BaseWatcher):
 
             # Method 2: Also check for invitation badge (backup)
             if not new_requests:
+                from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
                 try:
-                    badge_selectors = [
-                        'button[aria-label*="invitation"] span[aria-hidden="true"]',
-                        'button[aria-label*="Invitation"] span[aria-hidden="true"]',
-                        '[data-test="invitations-badge"]',
-                        'span.mynetwork-nav__badge',
-                        'nav[aria-label*="My Network"] span[aria-hidden="true"]',
-                    ]
-                    
-                    count_text = None
-                    for selector in badge_selectors:
-                        try:
-                            conn_badge = page.locator(selector).first
-                            if conn_badge.is_visible(timeout=2000):
-                                count_text = conn_badge.text_content(timeout=2000).strip()
-                                if count_text:
-                                    self.logger.debug(f'Found invitation badge: {count_text}')
-                                    break
-                        except:
-                            continue
+                    # One visibility wait shared by all badge markups; hidden badges don't count
+                    try:
+                        badge = await page.wait_for_selector(INVITATION_BADGE_SELECTOR, state='visible', timeout=2000)
+                        count_text = (await badge.inner_text()).strip() if badge else None
+                    except PlaywrightTimeoutError:
+                        count_text = None
+                    if count_text:
+                        self.logger.debug(f'Found invitation badge: {count_text}')
 
                     if count_text and count_text.isdigit() and int(count_text) > 0:
                         request_count = int(count_text)
-                        request_id = f"REQ_{int(time.time())}"
+                        request_id = self._next_request_id()
                         new_requests.append({
                             'type': 'connection_request',
                             'id': request_id,
@@ -790,24 +1201,29 @@ class LinkedInWatcher(BaseWatcher):
         Returns:
             Path: Path to the created action file
         """
+        # Already handled in an earlier check - don't write the same action file again
+        processed = getattr(self, PROCESSED_IDS_ATTR.get(item.get('type'), ''), None)
+        if processed is not None and item.get('id') in processed:
+            return Path('')
+
         try:
             if item['type'] == 'notification':
                 if item.get('requires_action', True):
                     filepath = self._create_notification_file(item)
-                    self.processed_notifications.add(item['id'])
+                    self._mark_notification_processed(item['id'])
                     if item.get('relevance', 0) > 0.8:
                         self._auto_approve_notification(item)
 
             elif item['type'] == 'connection_accepted':
                 if item.get('requires_action', True):
                     filepath = self._create_connection_accepted_file(item)
-                    self.processed_notifications.add(item['id'])
+                    self._mark_notification_processed(item['id'])
                     self.logger.info(f'✅ Created file for accepted connection')
 
             elif item['type'] == 'connection_request':
                 if item.get('requires_action', True):
                     filepath = self._create_connection_request_file(item)
-                    self.processed_requests.add(item['id'])
+                    self._mark_request_processed(item['id'])
                     if item.get('relevance', 0) > 0.9:
                         self._auto_approve_connection(item)
 
@@ -820,37 +1236,26 @@ class LinkedInWatcher(BaseWatcher):
             else:
                 return Path('')
 
-            # Save processed IDs
-            self._save_processed_ids()
-
             # Beautiful console output
-            type_emoji = {
-                'notification': '🔔',
-                'connection_accepted': '✅',
-                'connection_request': '🤝',
-                'business_post': '📝'
-            }.get(item['type'], '📌')
-
-            print(f"\n{'='*60}")
-            print(f"  {type_emoji} LINKEDIN {item['type'].upper().replace('_', ' ')} DETECTED!")
-            print(f"{'='*60}")
-            
+            type_emoji = TYPE_EMOJI.get(item['type'], '📌')
+
             if item['type'] == 'connection_accepted':
-                print(f"  📝 {item.get('text', 'N/A')[:70]}")
-                print(f"  🏷️  Relevance: {item.get('relevance', 0):.0%}")
+                details = [f"📝 {item.get('text', 'N/A')[:70]}",
+                           f"🏷️  Relevance: {item.get('relevance', 0):.0%}"]
             elif item['type'] == 'notification':
-                print(f"  📝 {item.get('text', 'N/A')[:70]}")
-                print(f"  🏷️  Type: {item.get('notification_type', 'General')}")
+                details = [f"📝 {item.get('text', 'N/A')[:70]}",
+                           f"🏷️  Type: {item.get('notification_type', 'General')}"]
             elif item['type'] == 'connection_request':
-                print(f"  👤 Name: {item.get('name', 'Unknown')}")
-                print(f"  💼 Details: {item.get('headline', 'N/A')[:50]}")
-                print(f"  🏷️  Relevance: {item.get('relevance', 0):.0%}")
-            elif item['type'] == 'business_post':
-                print(f"  📝 Template: {item.get('template', 'General')}")
-                print(f"  📂 Category: {item.get('category', 'General')}")
-            
-            print(f"  ✅ Action File: {filepath.name}")
-            print(f"{'='*60}\n")
+                details = [f"👤 Name: {item.get('name', 'Unknown')}",
+                           f"💼 Details: {item.get('headline', 'N/A')[:50]}",
+                           f"🏷️  Relevance: {item.get('relevance', 0):.0%}"]
+            else:
+                details = [f"📝 Template: {item.get('template', 'General')}",
+                           f"📂 Category: {item.get('category', 'General')}"]
+            details.append(f'✅ Action File: {filepath.name}')
+
+            self.banner.info('%s LINKEDIN %s DETECTED!\n%s', type_emoji,
+                             item['type'].upper().replace('_', ' '), '\n'.join(details))
 
             self.logger.info(f'Created action file for LinkedIn {item["type"]}: {item.get("id", "unknown")}')
             return filepath
@@ -859,52 +1264,6 @@ class LinkedInWatcher(BaseWatcher):
             self.logger.error(f'Error creating action file for LinkedIn {item.get("type", "unknown")}: {e}')
             return Path('')
 
-    def _create_notification_file(self, notification) -> Path:
-        """Create an action file for a LinkedIn notification."""
-        content = f"""---
-type: linkedin_notification
-source: linkedin
-id: {notification['id']}
-text: {notification['text']}
-time: {notification['time']}
-type: {notification['type']}
-status: pending
----
-
-# LinkedIn Notification
-
-**Type:** {notification['type']}
-**Time:** {notification['time']}
-
-## Notification Details
-
-**Text:** {notification['text']}
-
-## Suggested Actions
-
-- [ ] Review notification content
-- [ ] Determine appropriate response
-- [ ] Take required action based on notification
-- [ ] Move to appropriate folder after processing
-
-## Common Notification Types
-
-- **Job Updates:** Review new job postings or updates
-- **Connection Updates:** Check connection status changes
-- **Company Updates:** Review company news and updates
-- [ ] Reply or engage with content if appropriate
-- [ ] Archive notification after processing
-
----
-*Generated by LinkedIn Watcher*
-"""
-
-        filepath = self.needs_action / f'LINKEDIN_NOTIFICATION_{notification['id']}.md'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        return filepath
-
     def _auto_approve_notification(self, notification):
         """Auto-approve high-relevance notifications."""
         try:
@@ -968,207 +1327,60 @@ status: pending
 
     def _create_notification_file(self, notification) -> Path:
         """Create an action file for a LinkedIn notification."""
-        content = f"""---
-type: linkedin_notification
-source: linkedin
-id: {notification['id']}
-text: {notification['text']}
-time: {notification['time']}
-notification_type: {notification['notification_type']}
-status: pending
-relevance: {notification.get('relevance', 0)}
----
-
-# LinkedIn Notification
-
-**Type:** {notification['notification_type']}
-**Time:** {notification['time']}
-
-## Notification Details
-
-**Text:** {notification['text']}
-
-## Suggested Actions
-
-- [ ] Review notification content
-- [ ] Determine appropriate response
-- [ ] Take required action based on notification
-- [ ] Move to appropriate folder after processing
-
-## Common Notification Types
-
-- **Job Updates:** Review new job postings or updates
-- **Connection Updates:** Check connection status changes
-- **Company Updates:** Review company news and updates
-- [ ] Reply or engage with content if appropriate
-- [ ] Archive notification after processing
-
----
-*Generated by LinkedIn Watcher*
-"""
+        content = NOTIFICATION_FILE_TEMPLATE.format(
+            id=notification['id'],
+            text=notification['text'],
+            time=notification['time'],
+            notification_type=notification['notification_type'],
+            relevance=notification.get('relevance', 0)
+        )
 
         filepath = self.needs_action / f'LINKEDIN_NOTIFICATION_{notification["id"]}.md'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_text(content, encoding='utf-8')
 
         return filepath
 
     def _create_connection_accepted_file(self, connection) -> Path:
         """Create an action file for an accepted connection."""
-        content = f"""---
-type: linkedin_connection_accepted
-source: linkedin
-id: {connection['id']}
-text: {connection['text']}
-time: {connection['time']}
-status: pending
-relevance: {connection.get('relevance', 0)}
----
-
-# LinkedIn Connection Accepted ✅
-
-**Notification:** {connection['text']}
-**Time:** {connection['time']}
-**Relevance Score:** {connection.get('relevance', 0):.1%}
-
-## What Happened
-
-Someone accepted your connection request on LinkedIn.
-
-## Suggested Actions
-
-- [ ] Review the new connection's profile
-- [ ] Send a personalized thank you message
-- [ ] Note any business opportunities
-- [ ] Add to CRM or contact management system
-- [ ] Engage with their recent posts
-- [ ] Schedule follow-up if relevant
-
-## Networking Best Practices
-
-1. **Personalize:** Send a custom message within 24 hours
-2. **Research:** Review their profile for common interests
-3. **Engage:** Like or comment on their recent posts
-4. **Follow-up:** Schedule a call if there's business potential
-
----
-*Generated by LinkedIn Watcher*
-"""
+        content = CONNECTION_ACCEPTED_FILE_TEMPLATE.format(
+            id=connection['id'],
+            text=connection['text'],
+            time=connection['time'],
+            relevance=connection.get('relevance', 0)
+        )
 
         filepath = self.needs_action / f'LINKEDIN_CONNECTION_ACCEPTED_{connection["id"]}.md'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_text(content, encoding='utf-8')
 
         return filepath
 
     def _create_business_post_file(self, post) -> Path:
         """Create an action file for a business post."""
-        content = f"""---
-type: linkedin_business_post
-source: linkedin
-id: {post['id']}
-template: {post['template']}
-category: {post['category']}
-status: pending
-relevance: {post.get('relevance', 0)}
----
-
-# LinkedIn Business Post
-
-**Template:** {post['template']}
-**Category:** {post['category']}
-**Relevance Score:** {post.get('relevance', 0)}
-
-## Post Content
-
-{post['content']}
-
-## Suggested Actions
-
-- [ ] Review post content
-- [ ] Check for any errors or improvements
-- [ ] Approve for posting
-- [ ] Schedule post for optimal time
-- [ ] Monitor engagement after posting
-
-## Posting Guidelines
-
-1. **Professional Tone:** Ensure content is professional and engaging
-2. **Relevant Hashtags:** Add 3-5 relevant hashtags
-3. **Timing:** Post during business hours (9 AM - 5 PM)
-4. **Engagement:** Respond to comments within 24 hours
-
-## Approval Required
-
-This post requires human approval before publishing.
-
----
-*Generated by LinkedIn Watcher*
-"""
+        content = BUSINESS_POST_FILE_TEMPLATE.format(
+            id=post['id'],
+            template=post['template'],
+            category=post['category'],
+            relevance=post.get('relevance', 0),
+            content=post['content']
+        )
 
         filepath = self.needs_action / f'LINKEDIN_POST_{post["id"]}.md'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_text(content, encoding='utf-8')
 
         return filepath
 
     def _create_connection_request_file(self, request) -> Path:
         """Create an action file for a LinkedIn connection request."""
-        content = f"""---
-type: linkedin_connection_request
-source: linkedin
-id: {request['id']}
-name: {request['name']}
-headline: {request['headline']}
-mutual_connections: {request['mutual']}
-status: pending
-relevance: {request.get('relevance', 0)}
----
-
-# LinkedIn Connection Request
-
-**From:** {request['name']}
-**Headline:** {request['headline']}
-**Mutual Connections:** {request['mutual']}
-**Relevance Score:** {request.get('relevance', 0)}
-
-## Connection Request Details
-
-A new connection request has been received. Review the profile and decide whether to accept or ignore.
-
-## Suggested Actions
-
-- [ ] Review the person's profile
-- [ ] Check mutual connections
-- [ ] Evaluate relevance to your network
-- [ ] Decide whether to accept or ignore
-
-## Decision Options
-
-### Accept Connection
-- [ ] Review their profile and experience
-- [ ] Check if they're in your industry
-- [ ] Evaluate potential mutual benefits
-- [ ] Send personalized acceptance message
-
-### Ignore Request
-- [ ] If not relevant to your network
-- [ ] If spam or irrelevant connection
-- [ ] If you don't know the person
-
-## Profile Information
-
-**Name:** {request['name']}
-**Headline:** {request['headline']}
-**Mutual Connections:** {request['mutual']}
-
----
-*Generated by LinkedIn Watcher*
-"""
+        content = CONNECTION_REQUEST_FILE_TEMPLATE.format(
+            id=request['id'],
+            name=request['name'],
+            headline=request['headline'],
+            mutual=request['mutual'],
+            relevance=request.get('relevance', 0)
+        )
 
         filepath = self.needs_action / f'LINKEDIN_REQUEST_{request["id"]}.md'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_text(content, encoding='utf-8')
 
         return filepath
 
@@ -1217,23 +1429,25 @@ if __name__ == "__main__":
     watcher = LinkedInWatcher(vault_path, session_path, check_interval=300)
     
     # Beautiful startup banner
-    print("\n" + "=" * 60)
-    print("  💼  LINKEDIN PROFESSIONAL WATCHER")
-    print("=" * 60)
-    print(f"  📂 Vault: {vault_path.split(chr(92))[-1]}")
-    print(f"  ⏱️  Check Interval: 5 minutes")
-    print(f"  🔔 Monitoring: Notifications & Connections")
-    print("=" * 60)
-    print("  ✅ Watching for activity...")
-    print("  Press Ctrl+C to stop")
-    print("=" * 60 + "\n")
+    sys.stdout.write('\n'.join([
+        '',
+        BANNER_RULE,
+        "  💼  LINKEDIN PROFESSIONAL WATCHER",
+        BANNER_RULE,
+        f"  📂 Vault: {vault_path.split(chr(92))[-1]}",
+        "  ⏱️  Check Interval: 5 minutes",
+        "  🔔 Monitoring: Notifications & Connections",
+        BANNER_RULE,
+        "  ✅ Watching for activity...",
+        "  Press Ctrl+C to stop",
+        BANNER_RULE,
+        '\n'
+    ]))
 
     atexit.register(watcher.close_browser)
 
     try:
         watcher.run()
     except KeyboardInterrupt:
-        print("\n" + "=" * 60)
-        print("  🛑  Stopped by user")
-        print("=" * 60 + "\n")
+        watcher.banner.info('🛑  Stopped by user')
         watcher.close_browser()
\ No newline at end of file
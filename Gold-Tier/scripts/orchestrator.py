@@ -6,12 +6,189 @@ and maintains the overall system health.
 """
 
 import os
+import re
 import time
+import errno
+import shutil
+import hashlib
+import asyncio
 import logging
+import logging.handlers
 import subprocess
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+from base_watcher import atomic_write_text
+
+# Seconds between health checks, run on a timer independent of task events
+HEALTH_CHECK_INTERVAL = 300
+
+# Size cap and rotated copies kept for each orchestrator log file
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 5
+
+# Log line format shared by the file and console handlers
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Upper bound on tasks being processed at the same time
+MAX_CONCURRENT_TASKS = 8
+
+# Number of task analyses remembered by content, so duplicate drops aren't re-analysed
+PLAN_CACHE_SIZE = 512
+
+# Seconds a task file must go without further events before it is processed,
+# so a watcher that is still writing it isn't read half-way through
+TASK_SETTLE_SECONDS = 0.5
+
+# Delay before a task that failed to process is retried, doubling per consecutive failure up to the cap
+TASK_RETRY_SECONDS = 30
+TASK_RETRY_MAX_SECONDS = 600
+
+# YAML frontmatter block at the top of a task file, and the type: line inside it
+FRONTMATTER_RE = re.compile(r'\A---\r?\n(.*?)\r?\n---', re.S)
+TASK_TYPE_RE = re.compile(r'^[ \t]*type:[ \t]*([^:\r\n]*)', re.M)
+
+# Plan file layout, rendered with str.format
+PLAN_FILE_TEMPLATE = """---
+name: {stem}_plan
+type: task_plan
+created: {created}
+task_type: {task_type}
+status: pending
+---
+
+# Task Plan: {task_summary}
+
+## Task Details
+
+**Original File:** {name}
+**Type:** {task_type}
+**Received:** {received}
+
+## Analysis
+
+Based on the task content, this appears to be a file drop that requires processing.
+
+The file "{name}" was dropped into the system and needs to be handled according to its type and content.
+
+## Action Plan
+
+### Step 1: File Analysis
+- [ ] Analyze the file content and type
+- [ ] Determine appropriate processing method
+- [ ] Check for any special requirements
+
+### Step 2: Content Processing
+- [ ] Process the file according to its type
+- [ ] Extract relevant information
+- [ ] Generate appropriate output
+
+### Step 3: Action Execution
+- [ ] Execute the required actions
+- [ ] Generate any necessary output files
+- [ ] Update the system state
+
+### Step 4: Completion
+- [ ] Move original file to appropriate location
+- [ ] Update task status
+- [ ] Log completion
+
+## Approval Required
+
+This plan requires human approval before execution, especially for:
+- File operations outside the vault
+- External communications
+- Any actions that modify system state
+
+## Next Steps
+
+1. Review this plan in the `Plans` folder
+2. Move to `Pending_Approval` if ready for execution
+3. Human approval will trigger action execution
+4. Completed tasks move to `Done`
+
+---
+*Generated by Personal AI Employee Orchestrator v0.1*"""
+
+def _scan_files(folder: Path, suffix: str):
+    """Yield the directory entries in folder whose names end with suffix."""
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield entry
+
+def _ensure_dir(path: Path):
+    """Create a directory unless it already exists; the usual case costs one stat."""
+    if not os.path.isdir(path):
+        path.mkdir(parents=True, exist_ok=True)
+
+def _move_file(src: Path, dest: Path):
+    """Move src to dest, replacing dest; copies across filesystems."""
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dest)
+
+def _count_files(folder: Path, suffix: str) -> int:
+    """Count the files in folder whose names end with suffix."""
+    return sum(1 for _ in _scan_files(folder, suffix))
+
+class TaskEventHandler(FileSystemEventHandler):
+    def __init__(self, events: asyncio.Queue, loop: asyncio.AbstractEventLoop):
+        """
+        Initialize the Needs_Action event handler.
+
+        Args:
+            events (asyncio.Queue): Queue the paths of changed task files are put on
+            loop (asyncio.AbstractEventLoop): Loop that owns the queue
+        """
+        self.events = events
+        self.loop = loop
+
+    def _queue(self, path: str):
+        # Events arrive on the observer thread; hand them over to the event loop
+        if path.endswith('.md'):
+            self.loop.call_soon_threadsafe(self.events.put_nowait, Path(path))
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._queue(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._queue(event.src_path)
+
+    def on_moved(self, event):
+        # Files written atomically (temp file + rename) show up as moves
+        if not event.is_directory:
+            self._queue(event.dest_path)
+
+class FolderCountHandler(FileSystemEventHandler):
+    def __init__(self, key: str, stale: set):
+        """
+        Initialize a handler that flags a folder's cached file count as stale.
+
+        Args:
+            key (str): Folder key in the orchestrator's count cache
+            stale (set): Set of folder keys whose counts need a rescan
+        """
+        self.key = key
+        self.stale = stale
+
+    def on_created(self, event):
+        self.stale.add(self.key)
+
+    def on_deleted(self, event):
+        self.stale.add(self.key)
+
+    def on_moved(self, event):
+        self.stale.add(self.key)
 
 class Orchestrator:
     def __init__(self, vault_path: str):
@@ -31,27 +208,50 @@ class Orchestrator:
         self.logs = self.vault_path / 'Logs'
 
         # Create folders if they don't exist
-        self.needs_action.mkdir(parents=True, exist_ok=True)
-        self.plans.mkdir(parents=True, exist_ok=True)
-        self.done.mkdir(parents=True, exist_ok=True)
-        self.pending_approval.mkdir(parents=True, exist_ok=True)
-        self.approved.mkdir(parents=True, exist_ok=True)
-        self.rejected.mkdir(parents=True, exist_ok=True)
-        self.logs.mkdir(parents=True, exist_ok=True)
-
-        # Set up logging
+        for folder in (self.needs_action, self.plans, self.done, self.pending_approval,
+                       self.approved, self.rejected, self.logs):
+            _ensure_dir(folder)
+
+        # Folders reported by health_check: key -> (folder, file suffix)
+        self._count_folders = {
+            'needs_action': (self.needs_action, '.md'),
+            'plans': (self.plans, '.md'),
+            'done': (self.done, '.md'),
+            'pending_approval': (self.pending_approval, '.md'),
+            'approved': (self.approved, '.md'),
+            'rejected': (self.rejected, '.md'),
+            'logs': (self.logs, '.log'),
+        }
+        # Cached counts are only trusted while run() has the folders under watch;
+        # filesystem events flag the folders that changed since the last scan
+        self._counts = dict.fromkeys(self._count_folders, 0)
+        self._stale_counts = set(self._count_folders)
+        self._watching_counts = False
+
+        # Task analysis (type, summary) keyed by a digest of the task content, most recent last
+        self._plan_cache = OrderedDict()
+
+        # Set up logging; console output comes from the root logger (basicConfig is a no-op when
+        # the caller already configured it), the size-capped daily log file is attached directly
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.logs / f'orchestrator_{datetime.now().strftime("%Y%m%d")}.log'),
-                logging.StreamHandler()
-            ]
+            format=LOG_FORMAT,
+            handlers=[logging.StreamHandler()]
         )
         self.logger = logging.getLogger('Orchestrator')
+        self.logger.setLevel(logging.INFO)
+        if not any(isinstance(h, logging.handlers.RotatingFileHandler) for h in self.logger.handlers):
+            file_handler = logging.handlers.RotatingFileHandler(
+                self.logs / f'orchestrator_{datetime.now().strftime("%Y%m%d")}.log',
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            self.logger.addHandler(file_handler)
 
         self.logger.info("Orchestrator initialized")
-        self.logger.info(f"Vault path: {self.vault_path}")
+        self.logger.info("Vault path: %s", self.vault_path)
 
     def check_for_tasks(self) -> List[Path]:
         """
@@ -61,14 +261,14 @@ class Orchestrator:
             List[Path]: List of task files to process
         """
         try:
-            tasks = list(self.needs_action.glob('*.md'))
-            self.logger.info(f'Found {len(tasks)} tasks in Needs_Action')
+            tasks = [Path(entry.path) for entry in _scan_files(self.needs_action, '.md')]
+            self.logger.info('Found %s tasks in Needs_Action', len(tasks))
             return tasks
         except Exception as e:
-            self.logger.error(f'Error checking for tasks: {e}')
+            self.logger.error('Error checking for tasks: %s', e)
             return []
 
-    def process_task(self, task_file: Path) -> bool:
+    async def process_task(self, task_file: Path) -> bool:
         """
         Process a single task file using Claude Code.
 
@@ -79,35 +279,33 @@ class Orchestrator:
             bool: True if processing was successful, False otherwise
         """
         try:
-            self.logger.info(f'Processing task: {task_file.name}')
+            self.logger.info('Processing task: %s', task_file.name)
 
             # Create a plan file
             plan_name = task_file.stem.replace('FILE_', 'PLAN_') + '.md'
             plan_file = self.plans / plan_name
 
             # Read the task content
-            with open(task_file, 'r', encoding='utf-8') as f:
-                task_content = f.read()
+            task_content = await asyncio.to_thread(task_file.read_text, encoding='utf-8')
 
             # Generate a plan using Claude Code
-            plan_content = self.generate_plan(task_content, task_file)
+            plan_content = await self.generate_plan(task_content, task_file)
 
             if plan_content:
-                # Write the plan to file
-                with open(plan_file, 'w', encoding='utf-8') as f:
-                    f.write(plan_content)
+                # Write the plan to file; readers never see a half-written plan
+                await asyncio.to_thread(atomic_write_text, plan_file, plan_content)
 
-                self.logger.info(f'Plan created: {plan_file.name}')
+                self.logger.info('Plan created: %s', plan_file.name)
                 return True
             else:
-                self.logger.warning(f'No plan generated for {task_file.name}')
+                self.logger.warning('No plan generated for %s', task_file.name)
                 return False
 
         except Exception as e:
-            self.logger.error(f'Error processing task {task_file.name}: {e}')
+            self.logger.error('Error processing task %s: %s', task_file.name, e)
             return False
 
-    def generate_plan(self, task_content: str, task_file: Path) -> str:
+    async def generate_plan(self, task_content: str, task_file: Path) -> str:
         """
         Generate an action plan using Claude Code.
 
@@ -121,69 +319,28 @@ class Orchestrator:
         # In a real implementation, this would call Claude Code
         # For now, we'll create a basic plan template
 
-        task_type = self.extract_task_type(task_content)
-        task_summary = self.extract_task_summary(task_content)
-
-        plan_content = f"""---
-name: {task_file.stem}_plan
-type: task_plan
-created: {datetime.now().isoformat()}
-task_type: {task_type}
-status: pending
----
-
-# Task Plan: {task_summary}
-
-## Task Details
-
-**Original File:** {task_file.name}
-**Type:** {task_type}
-**Received:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Analysis
-
-Based on the task content, this appears to be a file drop that requires processing.
-
-The file "{task_file.name}" was dropped into the system and needs to be handled according to its type and content.
-
-## Action Plan
-
-### Step 1: File Analysis
-- [ ] Analyze the file content and type
-- [ ] Determine appropriate processing method
-- [ ] Check for any special requirements
-
-### Step 2: Content Processing
-- [ ] Process the file according to its type
-- [ ] Extract relevant information
-- [ ] Generate appropriate output
-
-### Step 3: Action Execution
-- [ ] Execute the required actions
-- [ ] Generate any necessary output files
-- [ ] Update the system state
-
-### Step 4: Completion
-- [ ] Move original file to appropriate location
-- [ ] Update task status
-- [ ] Log completion
-
-## Approval Required
-
-This plan requires human approval before execution, especially for:
-- File operations outside the vault
-- External communications
-- Any actions that modify system state
-
-## Next Steps
-
-1. Review this plan in the `Plans` folder
-2. Move to `Pending_Approval` if ready for execution
-3. Human approval will trigger action execution
-4. Completed tasks move to `Done`
-
----
-*Generated by Personal AI Employee Orchestrator v0.1*"""
+        # Identical content (retries, duplicate notifications) reuses the earlier analysis
+        digest = hashlib.blake2b(task_content.encode('utf-8'), digest_size=16).digest()
+        analysis = self._plan_cache.get(digest)
+        if analysis is None:
+            task_type = self.extract_task_type(task_content)
+            analysis = (task_type, self.extract_task_summary(task_content, task_type))
+            self._plan_cache[digest] = analysis
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
+        else:
+            self._plan_cache.move_to_end(digest)
+        task_type, task_summary = analysis
+
+        now = datetime.now()
+        plan_content = PLAN_FILE_TEMPLATE.format(
+            stem=task_file.stem,
+            created=now.isoformat(),
+            task_type=task_type,
+            task_summary=task_summary,
+            name=task_file.name,
+            received=now.strftime('%Y-%m-%d %H:%M:%S'),
+        )
 
         return plan_content
 
@@ -198,28 +355,31 @@ This plan requires human approval before execution, especially for:
             str: Task type
         """
         # Look for type in YAML frontmatter
-        if 'type:' in content:
-            lines = content.split('\n')
-            for line in lines:
-                if line.strip().startswith('type:'):
-                    return line.split(':')[1].strip()
+        frontmatter = FRONTMATTER_RE.match(content)
+        if frontmatter:
+            match = TASK_TYPE_RE.search(frontmatter.group(1))
+            if match:
+                return match.group(1).strip()
         return 'unknown'
 
-    def extract_task_summary(self, content: str) -> str:
+    def extract_task_summary(self, content: str, task_type: Optional[str] = None) -> str:
         """
         Extract a summary of the task.
 
         Args:
             content (str): Content of the task file
+            task_type (Optional[str]): Task type already extracted from the content
 
         Returns:
             str: Task summary
         """
-        if 'type: file_drop' in content:
+        if task_type is None:
+            task_type = self.extract_task_type(content)
+        if task_type == 'file_drop':
             return 'File Drop Processing'
         return 'Task Processing'
 
-    def move_to_done(self, task_file: Path):
+    async def move_to_done(self, task_file: Path):
         """
         Move a completed task to the Done folder.
 
@@ -228,10 +388,10 @@ This plan requires human approval before execution, especially for:
         """
         try:
             dest = self.done / task_file.name
-            task_file.rename(dest)
-            self.logger.info(f'Moved {task_file.name} to Done')
+            await asyncio.to_thread(_move_file, task_file, dest)
+            self.logger.info('Moved %s to Done', task_file.name)
         except Exception as e:
-            self.logger.error(f'Error moving {task_file.name} to Done: {e}')
+            self.logger.error('Error moving %s to Done: %s', task_file.name, e)
 
     def run_watchers(self):
         """
@@ -247,7 +407,25 @@ This plan requires human approval before execution, especially for:
             # For now, we'll just log that we're starting it
             self.logger.info('File System Watcher started')
         except Exception as e:
-            self.logger.error(f'Error starting watchers: {e}')
+            self.logger.error('Error starting watchers: %s', e)
+
+    def _folder_counts(self) -> Dict[str, int]:
+        """
+        Get the file count of every folder reported by health_check,
+        rescanning only the folders that changed since the last call.
+
+        Returns:
+            Dict[str, int]: File count per folder key
+        """
+        if not self._watching_counts:
+            self._stale_counts.update(self._count_folders)
+
+        for key in list(self._stale_counts):
+            # Clear the flag before scanning, so a change during the scan flags it again
+            self._stale_counts.discard(key)
+            self._counts[key] = _count_files(*self._count_folders[key])
+
+        return dict(self._counts)
 
     def health_check(self):
         """
@@ -259,15 +437,10 @@ This plan requires human approval before execution, especially for:
         health = {
             'timestamp': datetime.now().isoformat(),
             'vault_path': str(self.vault_path),
-            'needs_action_count': len(list(self.needs_action.glob('*.md'))),
-            'plans_count': len(list(self.plans.glob('*.md'))),
-            'done_count': len(list(self.done.glob('*.md'))),
-            'pending_approval_count': len(list(self.pending_approval.glob('*.md'))),
-            'approved_count': len(list(self.approved.glob('*.md'))),
-            'rejected_count': len(list(self.rejected.glob('*.md'))),
-            'logs_count': len(list(self.logs.glob('*.log'))),
-            'status': 'healthy'
         }
+        for key, count in self._folder_counts().items():
+            health[f'{key}_count'] = count
+        health['status'] = 'healthy'
 
         # Check for any issues
         if health['needs_action_count'] > 10:
@@ -276,35 +449,160 @@ This plan requires human approval before execution, especially for:
 
         return health
 
-    def run(self):
+    async def _handle_task(self, task_file: Path) -> bool:
         """
-        Main orchestrator loop.
+        Process a task file and move it to Done on success.
+
+        Args:
+            task_file (Path): Path to the task file
+
+        Returns:
+            bool: True if the task was processed, False if it should be retried
         """
-        self.logger.info("Orchestrator started")
-        self.run_watchers()
+        async with self._task_semaphore:
+            if await self.process_task(task_file):
+                # Move to done after successful processing
+                await self.move_to_done(task_file)
+                return True
+            return False
+
+    async def _health_check_loop(self):
+        """
+        Log a health check every HEALTH_CHECK_INTERVAL seconds.
+        """
+        loop = asyncio.get_running_loop()
+        # Deadlines on the loop's monotonic clock, so the time a check takes
+        # doesn't push later checks back
+        next_health = loop.time() + HEALTH_CHECK_INTERVAL
+        while True:
+            await asyncio.sleep(next_health - loop.time())
+            try:
+                health = await asyncio.to_thread(self.health_check)
+                self.logger.info('Health check: %s', health)
+            except Exception as e:
+                self.logger.error('Error during health check: %s', e)
+            # Skip missed slots (e.g. after a suspend) rather than firing a burst
+            next_health = max(next_health + HEALTH_CHECK_INTERVAL, loop.time())
+
+    async def _run_async(self):
+        """
+        Watch Needs_Action and process tasks concurrently, at most
+        MAX_CONCURRENT_TASKS at a time.
+        """
+        loop = asyncio.get_running_loop()
+        # File I/O and plan generation run in worker threads; size the pool so every
+        # admitted task gets one, plus one for the health check. asyncio.run() shuts it down.
+        loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_TASKS + 1,
+            thread_name_prefix='orchestrator'
+        ))
+        self._task_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+        events = asyncio.Queue()
+        observer = Observer()
+        observer.schedule(
+            TaskEventHandler(events, loop),
+            str(self.needs_action),
+            recursive=False
+        )
+        for key, (folder, _) in self._count_folders.items():
+            observer.schedule(FolderCountHandler(key, self._stale_counts), str(folder), recursive=False)
+        observer.start()
+        self._stale_counts.update(self._count_folders)
+        self._watching_counts = True
+        health_task = asyncio.create_task(self._health_check_loop())
+
+        # Tasks being processed, so a file that keeps changing isn't handled twice at once
+        in_flight = {}
+        # Task path -> monotonic time of its latest event (or of a scheduled retry)
+        pending = {}
+        # Task path -> consecutive failed attempts, for the retry backoff
+        failures = {}
+
+        def finished(task_file: Path, task: asyncio.Task):
+            in_flight.pop(task_file, None)
+            if task.cancelled():
+                return
+            if task.exception() is None and task.result():
+                failures.pop(task_file, None)
+                return
+            # Failed; retry after a backoff unless a newer event already queued it
+            attempts = failures[task_file] = failures.get(task_file, 0) + 1
+            delay = min(TASK_RETRY_SECONDS * 2 ** (attempts - 1), TASK_RETRY_MAX_SECONDS)
+            self.logger.warning('Task %s failed; retrying in %ds', task_file.name, delay)
+            pending.setdefault(task_file, time.monotonic() + delay - TASK_SETTLE_SECONDS)
+            # Wake the loop so it sees the new deadline
+            events.put_nowait(None)
+
+        def start(task_file: Path):
+            task = asyncio.create_task(self._handle_task(task_file))
+            in_flight[task_file] = task
+            task.add_done_callback(lambda done: finished(task_file, done))
 
         try:
-            while True:
-                # Check for tasks every 30 seconds
-                tasks = self.check_for_tasks()
+            # Drain tasks that arrived before the observer was attached
+            for task_file in self.check_for_tasks():
+                start(task_file)
 
-                for task_file in tasks:
-                    if self.process_task(task_file):
-                        # Move to done after successful processing
-                        self.move_to_done(task_file)
+            while True:
+                # Start every task that has gone quiet, as one wave
+                now = time.monotonic()
+                next_check = None
+                for task_file, seen in list(pending.items()):
+                    settles_at = seen + TASK_SETTLE_SECONDS
+                    if task_file in in_flight:
+                        # Still being processed; look again once it may have finished
+                        settles_at = now + TASK_SETTLE_SECONDS
+                    elif settles_at <= now:
+                        del pending[task_file]
+                        # Already moved to Done, or deleted before it settled
+                        if task_file.exists():
+                            start(task_file)
+                        else:
+                            failures.pop(task_file, None)
+                        continue
+                    next_check = settles_at if next_check is None else min(next_check, settles_at)
+
+                # Sleep until the next file settles or another event arrives
+                timeout = None if next_check is None else next_check - now
+                try:
+                    task_file = await asyncio.wait_for(events.get(), timeout)
+                except asyncio.TimeoutError:
+                    continue
+
+                # A bulk drop queues many events at once; take them all in one wake-up
+                # (None only wakes the loop for a scheduled retry)
+                now = time.monotonic()
+                while True:
+                    if task_file is not None:
+                        pending[task_file] = now
+                    if events.empty():
+                        break
+                    task_file = events.get_nowait()
+        finally:
+            self._watching_counts = False
+            health_task.cancel()
+            observer.stop()
+            await asyncio.to_thread(observer.join)
+            if in_flight:
+                await asyncio.gather(*in_flight.values(), return_exceptions=True)
 
-                # Perform health check every 5 minutes
-                if datetime.now().minute % 5 == 0:
-                    health = self.health_check()
-                    self.logger.info(f'Health check: {health}')
+    def run(self):
+        """
+        Main orchestrator loop.
 
-                # Sleep for 30 seconds
-                time.sleep(30)
+        Task files are picked up from filesystem events on Needs_Action
+        instead of rescanning the folder on a fixed interval, and several
+        tasks are processed concurrently on one event loop.
+        """
+        self.logger.info("Orchestrator started")
+        self.run_watchers()
 
+        try:
+            asyncio.run(self._run_async())
         except KeyboardInterrupt:
             self.logger.info("Orchestrator stopped")
         except Exception as e:
-            self.logger.error(f'Fatal error in orchestrator: {e}')
+            self.logger.error('Fatal error in orchestrator: %s', e)
             raise
 
 if __name__ == "__main__":
@@ -318,9 +616,14 @@ if __name__ == "__main__":
     # Set up logging
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=LOG_FORMAT,
         handlers=[
-            logging.FileHandler('orchestrator.log', encoding='utf-8'),
+            logging.handlers.RotatingFileHandler(
+                'orchestrator.log',
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding='utf-8'
+            ),
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -6,14 +6,53 @@ and other periodic tasks in the Personal AI Employee system.
 """
 
 import time
-import schedule
+import heapq
+import asyncio
+import itertools
 import json
 import logging
+import sqlite3
+import orjson
 from datetime import datetime, timedelta
-from threading import Thread, Event
+from threading import Thread, Lock
 from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 
+# One row per task; data is the orjson-encoded task dict
+TASKS_SCHEMA = """CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    next_run REAL
+)"""
+
+# Hour of day that daily, weekly and monthly tasks fire at
+RUN_AT_HOUR = 9
+
+def _next_fire_time(interval: str, after: float) -> float:
+    """
+    Get the next time a task with the given interval fires after a timestamp.
+
+    Args:
+        interval (str): "daily", "weekly" (Mondays), "monthly" (every 30 days)
+            or a number of seconds
+        after (float): Timestamp to schedule after
+
+    Returns:
+        float: Timestamp of the next run
+    """
+    if interval == "monthly":
+        return after + timedelta(days=30).total_seconds()
+    if interval not in ("daily", "weekly"):
+        return after + int(interval)
+
+    start = datetime.fromtimestamp(after)
+    next_run = start.replace(hour=RUN_AT_HOUR, minute=0, second=0, microsecond=0)
+    if interval == "weekly":
+        next_run += timedelta(days=-next_run.weekday() % 7)
+    while next_run <= start:
+        next_run += timedelta(days=7 if interval == "weekly" else 1)
+    return next_run.timestamp()
+
 class TaskScheduler:
     def __init__(self, config_path: str = "scheduler_config.json"):
         """
@@ -27,19 +66,36 @@ class TaskScheduler:
         self.logger = self._setup_logger()
         self.logger.info("Task Scheduler initialized")
 
-        # Scheduled tasks
-        self.tasks = []
+        # Scheduled tasks, keyed by task id in insertion order
+        self._tasks_by_id = {}
         self.running = False
         self.scheduler_thread = None
-        self.scheduler_event = Event()
 
-        # Persistence
+        # Runnable jobs (task id -> (interval, func, args, kwargs)) and a heap of
+        # (next run timestamp, sequence, task id), owned by the scheduler's event loop
+        self._jobs = {}
+        self._heap = []
+        self._sequence = itertools.count()
+        self._running_jobs = set()
+        self._loop = asyncio.new_event_loop()
+        self._wakeup = asyncio.Event()
+
+        # Persistence; each change writes only its own row. The JSON file is
+        # the old format, imported once into an empty database
+        self.db_path = self.config_path.parent / "scheduler.db"
         self.persistence_file = self.config_path.parent / "scheduled_tasks.json"
+        self._db_lock = Lock()
+        self._db = self._open_db()
         self._load_persisted_tasks()
 
         # Start scheduler
         self._start_scheduler()
 
+    @property
+    def tasks(self) -> List[Dict[str, Any]]:
+        """All scheduled tasks, in the order they were added."""
+        return list(self._tasks_by_id.values())
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
@@ -64,7 +120,7 @@ class TaskScheduler:
                 self._save_config(default_config)
                 return default_config
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
+            self.logger.error("Error loading config: %s", e)
             raise
 
     def _save_config(self, config: Dict[str, Any]):
@@ -73,7 +129,7 @@ class TaskScheduler:
             with open(self.config_path, 'w') as f:
                 json.dump(config, f, indent=2)
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
 
     def _setup_logger(self):
         """Set up logging."""
@@ -103,49 +159,115 @@ class TaskScheduler:
         """Start the scheduler."""
         if self.config["scheduler"]["enabled"]:
             self.running = True
-            self.scheduler_thread = Thread(target=self._scheduler_loop)
+            self.scheduler_thread = Thread(target=self._loop.run_until_complete,
+                                           args=(self._scheduler_loop(),))
             self.scheduler_thread.daemon = True
             self.scheduler_thread.start()
             self.logger.info("Task scheduler started")
 
-    def _scheduler_loop(self):
-        """Main scheduler loop."""
+    async def _scheduler_loop(self):
+        """Main scheduler loop; sleeps until the earliest task is due."""
+        semaphore = asyncio.Semaphore(self.config["scheduler"]["max_concurrent_tasks"])
+
         while self.running:
             try:
-                schedule.run_pending()
-                self.scheduler_event.wait(self.config["scheduler"]["check_interval"])
-                self.scheduler_event.clear()
+                delay = self._heap[0][0] - time.time() if self._heap else None
+                if delay is None or delay > 0:
+                    # Woken early by add_task or cleanup
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                    continue
+
+                _, _, task_id = heapq.heappop(self._heap)
+                job = self._jobs.get(task_id)
+                if job is None:
+                    # Removed since it was scheduled
+                    continue
+
+                run = asyncio.create_task(self._run_job(task_id, job, semaphore))
+                self._running_jobs.add(run)
+                run.add_done_callback(self._running_jobs.discard)
+                self._push(_next_fire_time(job[0], time.time()), task_id)
+            except Exception as e:
+                self.logger.error("Error in scheduler loop: %s", e)
+
+    async def _run_job(self, task_id: str, job: tuple, semaphore: asyncio.Semaphore):
+        """Run a job's function in a worker thread, bounded by max_concurrent_tasks."""
+        _, func, args, kwargs = job
+        async with semaphore:
+            try:
+                await asyncio.to_thread(func, *args, **kwargs)
+                self.logger.info("Task %s executed successfully", task_id)
             except Exception as e:
-                self.logger.error(f"Error in scheduler loop: {e}")
+                self.logger.error("Error executing task %s: %s", task_id, e)
+
+    def _push(self, next_ts: float, task_id: str):
+        """Add a run to the heap; only called on the scheduler's event loop."""
+        heapq.heappush(self._heap, (next_ts, next(self._sequence), task_id))
+        self._wakeup.set()
+
+    def _schedule_job(self, next_ts: float, task_id: str):
+        """Hand a run over to the scheduler's event loop from any thread."""
+        if self.running:
+            self._loop.call_soon_threadsafe(self._push, next_ts, task_id)
+
+    def _drop(self, task_id: str):
+        """Remove a task's pending run from the heap; only called on the scheduler's event loop."""
+        self._heap = [entry for entry in self._heap if entry[2] != task_id]
+        heapq.heapify(self._heap)
+
+    def _unschedule_job(self, task_id: str):
+        """Hand a removal over to the scheduler's event loop from any thread."""
+        if self.running:
+            self._loop.call_soon_threadsafe(self._drop, task_id)
+
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the task database in autocommit WAL mode, shared by all threads under _db_lock."""
+        db = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent without an fsync on every commit
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(TASKS_SCHEMA)
+        return db
 
     def _load_persisted_tasks(self):
         """Load persisted scheduled tasks."""
-        if self.persistence_file.exists():
-            with open(self.persistence_file, 'r') as f:
-                self.tasks = json.load(f)
-            self.logger.info(f"Loaded {len(self.tasks)} persisted tasks")
-
-    def _save_persisted_tasks(self):
-        """Save scheduled tasks to persistence file."""
-        with open(self.persistence_file, 'w') as f:
-            json.dump(self.tasks, f, indent=2)
-
-    def _get_next_run_time(self, interval: str, time_unit: str) -> datetime:
-        """Calculate next run time for a task."""
-        now = datetime.now()
-        if interval == "daily":
-            next_run = now.replace(hour=9, minute=0, second=0, microsecond=0)  # 9 AM daily
-            if next_run < now:
-                next_run += timedelta(days=1)
-        elif interval == "weekly":
-            next_run = now + timedelta(weeks=1)
-            next_run = next_run.replace(hour=9, minute=0, second=0, microsecond=0)
-        elif interval == "monthly":
-            next_run = now + timedelta(days=30)
-            next_run = next_run.replace(hour=9, minute=0, second=0, microsecond=0)
-        else:  # Custom interval in seconds
-            next_run = now + timedelta(seconds=int(interval))
-        return next_run
+        with self._db_lock:
+            rows = self._db.execute("SELECT data FROM tasks ORDER BY rowid").fetchall()
+        if rows:
+            self._tasks_by_id = {task["id"]: task for task in (orjson.loads(row[0]) for row in rows)}
+            self.logger.info("Loaded %s persisted tasks", len(self._tasks_by_id))
+        elif self.persistence_file.exists():
+            tasks = orjson.loads(self.persistence_file.read_bytes())
+            self._tasks_by_id = {task["id"]: task for task in tasks}
+            with self._db_lock:
+                self._db.execute("BEGIN")
+                for task in tasks:
+                    self._write_task(task)
+                self._db.execute("COMMIT")
+            self.logger.info("Imported %s tasks from %s", len(tasks), self.persistence_file.name)
+
+    def _write_task(self, task: Dict[str, Any]):
+        """Insert or update a task's row; the caller holds _db_lock."""
+        next_run = datetime.fromisoformat(task["next_run"]).timestamp()
+        self._db.execute(
+            "INSERT INTO tasks (id, data, next_run) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data, next_run = excluded.next_run",
+            (task["id"], orjson.dumps(task), next_run)
+        )
+
+    def _save_task(self, task: Dict[str, Any]):
+        """Persist one task."""
+        with self._db_lock:
+            self._write_task(task)
+
+    def _delete_task(self, task_id: str):
+        """Delete one task from the database."""
+        with self._db_lock:
+            self._db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
 
     def add_task(self, name: str, interval: str, time_unit: str,
                  task_func: Callable, *args, **kwargs) -> Dict[str, Any]:
@@ -164,11 +286,17 @@ class TaskScheduler:
             Dict[str, Any]: Task details
         """
         try:
-            self.logger.info(f"Adding task: {name}")
+            self.logger.info("Adding task: %s", name)
+            next_ts = _next_fire_time(interval, time.time())
+
+            # After a removal len + 1 can already be taken; never overwrite a task
+            number = len(self._tasks_by_id) + 1
+            while f"task_{number}" in self._tasks_by_id:
+                number += 1
 
             # Create task details
             task = {
-                "id": f"task_{len(self.tasks) + 1}",
+                "id": f"task_{number}",
                 "name": name,
                 "interval": interval,
                 "time_unit": time_unit,
@@ -176,51 +304,69 @@ class TaskScheduler:
                 "args": args,
                 "kwargs": kwargs,
                 "created_at": datetime.now().isoformat(),
-                "next_run": self._get_next_run_time(interval, time_unit).isoformat(),
+                "next_run": datetime.fromtimestamp(next_ts).isoformat(),
                 "status": "scheduled",
                 "retry_count": 0,
                 "max_retries": self.config["scheduler"]["retry_attempts"]
             }
 
-            # Schedule the task
-            if interval == "daily":
-                schedule.every().day.at("09:00").do(task_func, *args, **kwargs)
-            elif interval == "weekly":
-                schedule.every().monday.at("09:00").do(task_func, *args, **kwargs)
-            elif interval == "monthly":
-                schedule.every(30).days.do(task_func, *args, **kwargs)
-            else:
-                schedule.every(int(interval)).seconds.do(task_func, *args, **kwargs)
-
             # Add to task list
-            self.tasks.append(task)
-            self._save_persisted_tasks()
+            self._tasks_by_id[task["id"]] = task
+            self._save_task(task)
 
-            self.logger.info(f"Task {name} scheduled for {task['next_run']}")
+            # Schedule the task
+            self._jobs[task["id"]] = (interval, task_func, args, kwargs)
+            self._schedule_job(next_ts, task["id"])
+
+            self.logger.info("Task %s scheduled for %s", name, task['next_run'])
             return task
 
         except Exception as e:
-            self.logger.error(f"Error adding task {name}: {e}")
+            self.logger.error("Error adding task %s: %s", name, e)
             return {"success": False, "error": str(e)}
 
+    def register(self, task_id: str, task_func: Callable) -> Dict[str, Any]:
+        """
+        Attach a function to a task loaded from the task database and schedule it.
+
+        Args:
+            task_id (str): ID of the persisted task
+            task_func (Callable): Function to execute, called with the task's saved args and kwargs
+
+        Returns:
+            Dict[str, Any]: Result of the registration
+        """
+        task = self.get_task(task_id)
+        if not task:
+            return {"success": False, "error": "Task not found"}
+
+        scheduled = task_id in self._jobs
+        self._jobs[task_id] = (task["interval"], task_func, task["args"], task["kwargs"])
+        if not scheduled:
+            # Re-registering only swaps the function; the task already has a pending run
+            self._schedule_job(_next_fire_time(task["interval"], time.time()), task_id)
+        self.logger.info("Registered %s for task %s", task_func.__name__, task_id)
+        return {"success": True, "message": "Task registered successfully"}
+
     def remove_task(self, task_id: str) -> Dict[str, Any]:
         """Remove a scheduled task."""
         try:
             # Find and remove task
-            task = next((t for t in self.tasks if t["id"] == task_id), None)
+            task = self._tasks_by_id.pop(task_id, None)
             if not task:
                 return {"success": False, "error": "Task not found"}
 
-            # Remove from schedule (this is a simplified implementation)
-            # In a real implementation, you'd need to maintain a mapping of task_id to schedule
-            self.tasks = [t for t in self.tasks if t["id"] != task_id]
-            self._save_persisted_tasks()
+            # Remove from schedule. Until the loop drops its heap entry, a run that
+            # comes due is skipped because the job is gone
+            self._jobs.pop(task_id, None)
+            self._unschedule_job(task_id)
+            self._delete_task(task_id)
 
-            self.logger.info(f"Task {task_id} removed")
+            self.logger.info("Task %s removed", task_id)
             return {"success": True, "message": "Task removed successfully"}
 
         except Exception as e:
-            self.logger.error(f"Error removing task {task_id}: {e}")
+            self.logger.error("Error removing task %s: %s", task_id, e)
             return {"success": False, "error": str(e)}
 
     def list_tasks(self) -> List[Dict[str, Any]]:
@@ -229,7 +375,7 @@ class TaskScheduler:
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get details of a specific task."""
-        return next((t for t in self.tasks if t["id"] == task_id), None)
+        return self._tasks_by_id.get(task_id)
 
     def run_task_immediately(self, task_id: str) -> Dict[str, Any]:
         """Run a task immediately."""
@@ -238,31 +384,35 @@ class TaskScheduler:
             if not task:
                 return {"success": False, "error": "Task not found"}
 
-            # Get the function from globals() (simplified - in real implementation, use a registry)
-            func = globals().get(task["func_name"])
-            if not func:
-                return {"success": False, "error": "Task function not found"}
+            # Tasks loaded from the database have no function until register() is called
+            job = self._jobs.get(task_id)
+            if not job:
+                return {"success": False, "error": "Task function not registered"}
 
             # Execute the task
+            _, func, args, kwargs = job
             try:
-                result = func(*task["args"], **task["kwargs"])
-                self.logger.info(f"Task {task_id} executed successfully")
+                result = func(*args, **kwargs)
+                self.logger.info("Task %s executed successfully", task_id)
                 return {"success": True, "result": result}
             except Exception as e:
-                self.logger.error(f"Error executing task {task_id}: {e}")
+                self.logger.error("Error executing task %s: %s", task_id, e)
                 return {"success": False, "error": str(e)}
 
         except Exception as e:
-            self.logger.error(f"Error running task {task_id}: {e}")
+            self.logger.error("Error running task %s: %s", task_id, e)
             return {"success": False, "error": str(e)}
 
     def cleanup(self):
         """Clean up resources."""
         self.running = False
         if self.scheduler_thread:
-            self.scheduler_event.set()
+            self._loop.call_soon_threadsafe(self._wakeup.set)
             self.scheduler_thread.join(timeout=5)
 
+        with self._db_lock:
+            self._db.close()
+
         self.logger.info("Task Scheduler shutting down")
 
 # Example task functions
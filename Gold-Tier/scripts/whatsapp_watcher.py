@@ -2,22 +2,243 @@
 WhatsApp Watcher - Monitors WhatsApp Web for new messages and creates action files
 """
 
+import re
 import time
+import hashlib
+import functools
+import itertools
 import logging
 import os
 import shutil
 import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from playwright.sync_api import sync_playwright
-from base_watcher import BaseWatcher
+from base_watcher import BaseWatcher, atomic_write_lines, get_banner_logger
 from datetime import datetime
 
+# Words that make a chat worth an action file, and the subset that makes it high priority;
+# matched anywhere in the preview, case-insensitively
+KEYWORDS = ('urgent', 'asap', 'help', 'invoice', 'payment', 'important', 'need')
+HIGH_PRIORITY_KEYWORDS = ('urgent', 'asap', 'help')
+
+def keyword_pattern(keywords) -> re.Pattern:
+    """One case-insensitive alternation over keywords, searched in a single pass."""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+HIGH_PRIORITY_RE = keyword_pattern(HIGH_PRIORITY_KEYWORDS)
+
+# Preview lines containing any of these are timestamps, not message text
+TIMESTAMP_RE = re.compile('AM|PM|Yesterday|Today')
+
+# Action file names are WHATSAPP_<number>.md
+ACTION_FILE_RE = re.compile(r'WHATSAPP_(\d+)\.md\Z')
+
+# Action file layout, rendered with str.format
+ACTION_FILE_TEMPLATE = """---
+type: whatsapp_message
+source: whatsapp
+id: {id}
+from: {sender}
+message: {message}
+priority: {priority}
+received: {received}
+status: pending
+---
+
+# WhatsApp Message
+
+**From:** {sender}
+**Priority:** {priority_label}
+**Received:** {received_display}
+
+## Message Content
+
+{message}
+
+## Actions
+
+- [ ] Review and respond
+- [ ] Take required action
+
+---
+*Generated by WhatsApp Watcher*
+"""
+
+# Processed-message IDs are 64-bit blake2b digests, stored as 16 hex characters
+MESSAGE_ID_RE = re.compile(r'[0-9a-f]{16}\Z')
+
+def message_id(sender: str, message: str) -> str:
+    """Fixed-width ID of a message, derived from its sender and text."""
+    return hashlib.blake2b(f'{sender}\x00{message}'.encode('utf-8'), digest_size=8).hexdigest()
+
+def message_key(msg_id: str):
+    """In-memory form of an ID: message_id digests as ints (about half the size of the hex str), legacy IDs unchanged."""
+    return int(msg_id, 16) if MESSAGE_ID_RE.match(msg_id) else msg_id
+
+def legacy_message_id(sender: str, message: str) -> str:
+    """ID format used before message_id, still found in older processed-ID logs."""
+    return f"{sender}_{message[:50]}".replace(' ', '_').replace('/', '_').replace('\\', '_')
+
+# Chrome launch flags, shared by every browser (re)start
+CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--disable-features=TranslateUI',
+    '--disable-features=ChromeWhatsNewUI',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+
+@functools.cache
+def _find_chrome():
+    """Locate the installed Chrome executable once per process, or None to use Playwright's Chromium."""
+    chrome_paths = [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
+    ]
+
+    for path in chrome_paths:
+        if os.path.exists(path):
+            return path
+
+    return None
+
+# Chat row selectors, tried in order until one matches
+CHAT_ROW_SELECTORS = [
+    '[data-testid="chat-list"] [role="row"]',
+    '[data-testid="chat-list"] > div > div',
+    '#pane-side div[role="row"]',
+    'div[data-tab="3"] > div[role="row"]'
+]
+
+# Chat list containers, joined into one selector so a single wait returns on whichever
+# renders first; :visible skips hidden matches earlier in the document
+CHAT_LIST_SELECTORS = (
+    '[data-testid="chat-list"]',
+    '#pane-side',
+    'div[aria-label="Chats"]',
+    '[data-tab="3"]'
+)
+CHAT_LIST_SELECTOR = ', '.join(f'{selector}:visible' for selector in CHAT_LIST_SELECTORS)
+
+# True once any chat row selector matches, so the list is read as soon as it renders
+CHAT_ROWS_READY_JS = 'selectors => selectors.some(selector => document.querySelector(selector))'
+
+# Max time (ms) to wait for chat rows to render after the chat list appears
+CHAT_ROWS_TIMEOUT_MS = 10000
+
+# Number of chats from the top of the list read per check
+MAX_CHATS_PER_CHECK = 10
+
+# Returns {selector, rows: [{text, visible}]} for the top chat rows of the first
+# matching selector, replacing per-row count/is_visible/inner_text round trips
+READ_CHAT_ROWS_JS = """
+([selectors, limit]) => {
+    let selector = selectors[selectors.length - 1];
+    let rows = [];
+    for (const candidate of selectors) {
+        rows = document.querySelectorAll(candidate);
+        if (rows.length) {
+            selector = candidate;
+            break;
+        }
+    }
+    return {
+        selector,
+        rows: Array.from(rows).slice(0, limit).map(row => {
+            const box = row.getBoundingClientRect();
+            return {
+                text: row.innerText,
+                visible: box.width > 0 && box.height > 0
+                    && getComputedStyle(row).visibility !== 'hidden'
+            };
+        })
+    };
+}
+"""
+
+# Page binding the unread observer calls when the chat list's unread badges change
+UNREAD_BINDING = 'onWhatsAppUnread'
+
+# Seconds between full checks when no unread change has been pushed; a safety net
+# for changes the observer misses
+SAFETY_NET_INTERVAL = 300
+
+# Milliseconds per wait while idling, so Playwright dispatches pushed binding calls
+PUSH_WAIT_MS = 500
+
+# Runs at every document start: once #pane-side exists, watch it and report whenever
+# an unread badge appears or changes. Badges cleared by reading a chat are not reported.
+UNREAD_OBSERVER_JS = """
+(() => {
+    if (window.__whatsAppUnreadObserver) return;
+    window.__whatsAppUnreadObserver = true;
+
+    const unreadBadges = pane => new Set(Array.from(
+        pane.querySelectorAll('[aria-label*="unread"]'),
+        badge => badge.getAttribute('aria-label')
+    ));
+
+    const watchPane = pane => {
+        let last = unreadBadges(pane);
+        new MutationObserver(() => {
+            const current = unreadBadges(pane);
+            const appeared = Array.from(current).some(label => !last.has(label));
+            last = current;
+            if (appeared) {
+                window.%s({unread: current.size});
+            }
+        }).observe(pane, {childList: true, subtree: true, characterData: true,
+                          attributes: true, attributeFilter: ['aria-label']});
+    };
+
+    const waitForPane = () => {
+        const pane = document.querySelector('#pane-side');
+        if (pane) {
+            watchPane(pane);
+            return;
+        }
+        const finder = new MutationObserver(() => {
+            const found = document.querySelector('#pane-side');
+            if (found) {
+                finder.disconnect();
+                watchPane(found);
+            }
+        });
+        finder.observe(document.documentElement, {childList: true, subtree: true});
+    };
+
+    if (document.documentElement) {
+        waitForPane();
+    } else {
+        document.addEventListener('DOMContentLoaded', waitForPane);
+    }
+})();
+""" % UNREAD_BINDING
+
 class WhatsAppWatcher(BaseWatcher):
     def __init__(self, vault_path: str, session_path: str, check_interval: int = 30):
         super().__init__(vault_path, check_interval)
         self.session_path = session_path
+        # Console status banners (one write each)
+        self.banner = get_banner_logger('WhatsAppWatcher')
         self.processed_messages = set()
-        self.keywords = ['urgent', 'asap', 'help', 'invoice', 'payment', 'important', 'need']
+        # IDs processed since the last save, appended to the ID file on save
+        self._new_message_ids = []
+        self._has_legacy_ids = False
+
+        # Action file numbers continue after the highest one already in Needs_Action or Done
+        self._file_numbers = itertools.count(self._highest_file_number() + 1)
+        # Action files and the ID log are written on one worker thread, in submission order,
+        # so the next DOM scan isn't held up by file I/O; Playwright stays on the main thread
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='whatsapp-writer')
+        self.keywords = list(KEYWORDS)
+        self._keyword_re = keyword_pattern(self.keywords)
         self.logger = logging.getLogger('WhatsAppWatcher')
         self._load_processed_ids()
         self.logger.info('WhatsAppWatcher initialized')
@@ -25,26 +246,66 @@ class WhatsAppWatcher(BaseWatcher):
         self.browser = None
         self.page = None
 
-    def _cleanup_session(self):
-        """Clean up locked session files"""
+        # Chat row text by chat title as of the last check; unchanged rows are skipped
+        self._row_cache = {}
+
+        # Set by the page binding when the unread badges change; wakes the idle wait
+        self._unread_pushed = False
+
+    def _on_unread(self, source, payload):
+        """Page binding called by UNREAD_OBSERVER_JS when the unread chats change."""
+        self.logger.debug('Unread change pushed: %s', payload)
+        self._unread_pushed = True
+
+    def wait_for_next_check(self):
+        """
+        Idle until the page pushes an unread change, or SAFETY_NET_INTERVAL seconds
+        pass. Falls back to the plain check interval without a live page.
+        """
+        if not self.page:
+            return super().wait_for_next_check()
+
+        deadline = time.monotonic() + max(self.check_interval, SAFETY_NET_INTERVAL)
         try:
-            session_dir = Path(self.session_path)
-            if session_dir.exists():
-                # Remove all lock files
-                for lock_file in session_dir.glob('Singleton*'):
+            # The sync API only dispatches binding calls while a Playwright call is waiting
+            while not self._unread_pushed and time.monotonic() < deadline:
+                self.page.wait_for_timeout(PUSH_WAIT_MS)
+        except Exception as e:
+            self.logger.debug('Idle wait interrupted: %s', e)
+            time.sleep(self.check_interval)
+        self._unread_pushed = False
+
+    def _remove_lock_files(self, folder: Path):
+        """Remove Chrome's Singleton* and *.lock files from one folder in a single directory pass."""
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith('Singleton') or entry.name.endswith('.lock'):
                     try:
-                        lock_file.unlink()
-                        self.logger.info(f'Removed lock file: {lock_file}')
+                        os.unlink(entry.path)
+                        self.logger.info(f'Removed lock file: {entry.path}')
                     except Exception as e:
                         self.logger.debug(f'Could not remove lock file: {e}')
-                # Remove Chrome lock files
-                for lock_file in session_dir.glob('*.lock'):
-                    try:
-                        lock_file.unlink()
-                        self.logger.info(f'Removed .lock file: {lock_file}')
-                    except Exception as e:
-                        self.logger.debug(f'Could not remove .lock file: {e}')
-                # Remove Code Cache
+
+    def _cleanup_session(self, force: bool = False):
+        """
+        Clean up locked session files.
+
+        Args:
+            force (bool): Also delete Chrome's cache directories (only after a failed launch)
+        """
+        try:
+            session_dir = Path(self.session_path)
+            if session_dir.exists():
+                # Remove lock files from the profile root and its Default folder
+                self._remove_lock_files(session_dir)
+                default_folder = session_dir / 'Default'
+                if default_folder.exists():
+                    self._remove_lock_files(default_folder)
+
+                # Caches are kept so WhatsApp Web loads from disk; only wiped when the profile looks broken
+                if not force:
+                    return
+
                 for cache_dir in ['GPUCache', 'Code Cache', 'Shared Cache']:
                     cache_path = session_dir / cache_dir
                     if cache_path.exists():
@@ -53,15 +314,6 @@ class WhatsAppWatcher(BaseWatcher):
                             self.logger.info(f'Removed cache: {cache_path}')
                         except Exception as e:
                             self.logger.debug(f'Could not remove cache: {e}')
-                # Remove Default folder lock
-                default_folder = session_dir / 'Default'
-                if default_folder.exists():
-                    for lock_file in default_folder.glob('Singleton*'):
-                        try:
-                            lock_file.unlink()
-                            self.logger.info(f'Removed Default lock: {lock_file}')
-                        except Exception as e:
-                            self.logger.debug(f'Could not remove Default lock: {e}')
         except Exception as e:
             self.logger.debug(f'Session cleanup error: {e}')
 
@@ -88,44 +340,18 @@ class WhatsAppWatcher(BaseWatcher):
             self._cleanup_session()
             time.sleep(1)  # Give time for locks to be released
 
-            # Find Chrome executable
-            chrome_paths = [
-                r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
-            ]
-
-            chrome_executable = None
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    chrome_executable = path
-                    break
-
-            if not chrome_executable:
-                chrome_executable = "chrome"
-
-            self.logger.info(f'Using Chrome: {chrome_executable}')
+            chrome_executable = _find_chrome()
+            self.logger.info(f"Using Chrome: {chrome_executable or 'bundled Chromium'}")
 
             self.playwright = sync_playwright().start()
             
             # Launch with better stability options
             self.browser = self.playwright.chromium.launch_persistent_context(
                 self.session_path,
-                executable_path=chrome_executable if os.path.exists(chrome_executable) else None,
+                executable_path=chrome_executable,
                 headless=False,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--window-size=1920,1080',
-                    '--disable-features=TranslateUI',
-                    '--disable-features=ChromeWhatsNewUI',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                ],
+                args=CHROME_ARGS,
                 timeout=120000,
-                slow_mo=500,
                 ignore_default_args=['--enable-automation'],
             )
             self.page = self.browser.pages[0] if self.browser.pages else self.browser.new_page()
@@ -140,6 +366,13 @@ class WhatsAppWatcher(BaseWatcher):
                 """)
             except:
                 pass
+
+            # Push unread changes from the chat list instead of rescanning it on a timer
+            self.page.expose_binding(UNREAD_BINDING, self._on_unread)
+            self.page.add_init_script(UNREAD_OBSERVER_JS)
+            if self.page.url != 'about:blank':
+                # A restored tab has already loaded; init scripts only run on the next load
+                self.page.evaluate(UNREAD_OBSERVER_JS)
             
             self.logger.info('Browser initialized')
             return True
@@ -151,27 +384,64 @@ class WhatsAppWatcher(BaseWatcher):
                     self.playwright.stop()
             except:
                 pass
+            # A failed launch may mean a corrupt cache; wipe it before the next attempt
+            self._cleanup_session(force=True)
             self.browser = None
             self.page = None
             return False
 
+    def _highest_file_number(self) -> int:
+        """Highest WHATSAPP_<number>.md number in Needs_Action or Done, or 0 if there are none."""
+        highest = 0
+        for folder in (self.needs_action, self.vault_path / 'Done'):
+            if not folder.is_dir():
+                continue
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    match = ACTION_FILE_RE.match(entry.name)
+                    if match:
+                        highest = max(highest, int(match.group(1)))
+        return highest
+
     def _load_processed_ids(self):
+        """Load previously processed message IDs from the append-only ID log."""
         messages_file = Path(self.vault_path) / 'processed_whatsapp_messages.txt'
         if messages_file.exists():
-            with open(messages_file, 'r') as f:
-                self.processed_messages = set(f.read().splitlines())
+            raw = messages_file.read_text(encoding='utf-8')
+            lines = set(raw.splitlines())
+            lines.discard('')
+            self.processed_messages = set(map(message_key, lines))
+            # Logs from before message_id hold long IDs; only then do lookups need the old format too
+            self._has_legacy_ids = any(isinstance(key, str) for key in self.processed_messages)
+
+            # Older files were written without a trailing newline; fix up before appending to them
+            if raw and not raw.endswith('\n'):
+                atomic_write_lines(messages_file, lines)
 
     def _save_processed_ids(self):
-        """Save processed message IDs to file"""
+        """Append message IDs processed since the last save to the ID log."""
+        # Nothing new since the last save (the common case) - skip the file I/O
+        if not self._new_message_ids:
+            return
+
         try:
             messages_file = Path(self.vault_path) / 'processed_whatsapp_messages.txt'
-            with open(messages_file, 'w') as f:
-                f.write('\n'.join(self.processed_messages))
+            with open(messages_file, 'a', encoding='utf-8') as f:
+                f.writelines(msg_id + '\n' for msg_id in self._new_message_ids)
+            self._new_message_ids.clear()
         except Exception as e:
             self.logger.error(f'Error saving processed IDs: {e}')
 
+    def finish_batch(self):
+        """Append the IDs processed during this check to the ID log, once per check."""
+        # Queued behind this check's action files, so only IDs whose file was written are saved
+        self._writer.submit(self._save_processed_ids)
+
     def close_browser(self):
         """Close the browser when shutting down"""
+        # Let queued action files finish before the final save
+        self._writer.shutdown(wait=True)
+        self._save_processed_ids()
         try:
             if self.browser:
                 self.browser.close()
@@ -198,96 +468,61 @@ class WhatsAppWatcher(BaseWatcher):
                 self.logger.info('Loading WhatsApp Web...')
                 try:
                     self.page.goto('https://web.whatsapp.com', wait_until='domcontentloaded', timeout=90000)
-                    time.sleep(5)
                 except Exception as e:
                     self.logger.error(f'Failed to load WhatsApp Web: {e}')
                     try:
                         self.page.reload(wait_until='domcontentloaded', timeout=60000)
-                        time.sleep(3)
                     except:
                         return []
 
-            # Wait for chat list with multiple fallback selectors
-            chat_list_found = False
-            selectors = [
-                '[data-testid="chat-list"]',
-                '#pane-side',
-                'div[aria-label="Chats"]',
-                '[data-tab="3"]'
-            ]
-
-            for selector in selectors:
-                try:
-                    self.page.wait_for_selector(selector, timeout=10000, state='visible')
-                    chat_list_found = True
-                    self.logger.debug(f'Found chat list: {selector}')
-                    break
-                except:
-                    continue
-
-            if not chat_list_found:
+            # Wait for the chat list (any of the known containers)
+            try:
+                self.page.wait_for_selector(CHAT_LIST_SELECTOR, timeout=10000, state='visible')
+            except Exception:
                 self.logger.info("Please scan QR code in browser...")
-                for selector in selectors:
-                    try:
-                        self.page.wait_for_selector(selector, timeout=60000, state='visible')
-                        chat_list_found = True
-                        self.logger.debug(f'Chat list found after QR scan: {selector}')
-                        break
-                    except:
-                        continue
-
-                if not chat_list_found:
+                try:
+                    self.page.wait_for_selector(CHAT_LIST_SELECTOR, timeout=60000, state='visible')
+                    self.logger.debug('Chat list found after QR scan')
+                except Exception:
                     self.logger.error('Chat list not found after QR scan')
                     return []
 
-            time.sleep(2)
-
-            # Find all chats
-            chat_selectors = [
-                '[data-testid="chat-list"] [role="row"]',
-                '[data-testid="chat-list"] > div > div',
-                '#pane-side div[role="row"]',
-                'div[data-tab="3"] > div[role="row"]'
-            ]
-
-            chats = None
-            for selector in chat_selectors:
-                try:
-                    chats = self.page.locator(selector)
-                    count = chats.count()
-                    if count > 0:
-                        self.logger.debug(f'Found {count} chats using: {selector}')
-                        break
-                except:
-                    continue
-
-            if not chats:
-                chats = self.page.locator('#pane-side div[role="row"]')
+            # Wait for the rows themselves rather than a fixed delay
+            try:
+                self.page.wait_for_function(CHAT_ROWS_READY_JS, arg=CHAT_ROW_SELECTORS, timeout=CHAT_ROWS_TIMEOUT_MS)
+            except Exception as e:
+                self.logger.debug(f'Chat rows not rendered yet: {e}')
 
-            count = chats.count()
-            self.logger.debug(f"Total chats: {count}")
+            # Read the top chat rows in one round trip
+            snapshot = self.page.evaluate(READ_CHAT_ROWS_JS, [CHAT_ROW_SELECTORS, MAX_CHATS_PER_CHECK])
+            chats = self.page.locator(snapshot['selector'])
+            rows = snapshot['rows']
+            self.logger.debug(f"Read {len(rows)} chats using: {snapshot['selector']}")
 
             # Process recent chats
-            for i in range(min(count, 10)):
+            for i, row in enumerate(rows):
                 try:
-                    chat = chats.nth(i)
-                    if not chat.is_visible(timeout=2000):
+                    if not row['visible']:
                         continue
 
                     # Get chat preview text
-                    preview_text = chat.inner_text(timeout=2000)
+                    preview_text = row['text']
                     preview_lines = preview_text.split('\n')
 
                     if len(preview_lines) < 2:
                         continue
 
                     title = preview_lines[0].strip()
+
+                    # Rows whose text hasn't changed since the last check have nothing new
+                    if self._row_cache.get(title) == preview_text:
+                        continue
                     
                     # Get message from preview (skip title and timestamps)
                     preview_message = ''
                     for line in preview_lines[1:]:
                         line = line.strip()
-                        if line and not any(x in line for x in ['AM', 'PM', 'Yesterday', 'Today']):
+                        if line and not TIMESTAMP_RE.search(line):
                             preview_message = line
                             break
                     
@@ -298,14 +533,13 @@ class WhatsAppWatcher(BaseWatcher):
                         continue
 
                     # Check for keywords in preview
-                    text_lower = preview_message.lower()
-                    if any(kw in text_lower for kw in self.keywords):
+                    if self._keyword_re.search(preview_message):
+                        high_priority = HIGH_PRIORITY_RE.search(preview_message) is not None
                         # Click on chat to get full message
                         try:
-                            chat.click()
-                            time.sleep(1)
+                            chats.nth(i).click()
                             
-                            # Get full message from chat header
+                            # Get full message from chat header (inner_text waits up to 3s for the bubble)
                             try:
                                 messagebubble = self.page.locator('div[data-testid="message-container"] span[title]').first
                                 full_message = messagebubble.inner_text(timeout=3000)
@@ -316,15 +550,18 @@ class WhatsAppWatcher(BaseWatcher):
                             
                             # Go back to chat list
                             self.page.keyboard.press('Escape')
-                            time.sleep(0.5)
                         except Exception as e:
                             self.logger.debug(f'Could not click chat: {e}')
                         
                         # Create unique ID
-                        msg_id = f"{title}_{preview_message[:50]}".replace(' ', '_').replace('/', '_').replace('\\', '_')
-                        
-                        if msg_id not in self.processed_messages:
-                            priority = 'high' if any(kw in text_lower for kw in ['urgent', 'asap', 'help']) else 'normal'
+                        msg_id = message_id(title, preview_message)
+                        seen = message_key(msg_id) in self.processed_messages or (
+                            self._has_legacy_ids
+                            and legacy_message_id(title, preview_message) in self.processed_messages
+                        )
+
+                        if not seen:
+                            priority = 'high' if high_priority else 'normal'
                             new_messages.append({
                                 'id': msg_id,
                                 'from': title,
@@ -333,13 +570,9 @@ class WhatsAppWatcher(BaseWatcher):
                             })
                             # Beautiful console output for new messages
                             priority_emoji = "🔴" if priority == 'high' else "🟢"
-                            print(f"\n{'='*60}")
-                            print(f"  {priority_emoji} NEW MESSAGE DETECTED!")
-                            print(f"{'='*60}")
-                            print(f"  👤 From: {title}")
-                            print(f"  📝 Message: {preview_message[:60]}")
-                            print(f"  🏷️  Priority: {priority.upper()}")
-                            print(f"{'='*60}\n")
+                            self.banner.info('%s NEW MESSAGE DETECTED!\n👤 From: %s\n📝 Message: %s\n🏷️  Priority: %s',
+                                             priority_emoji, title, preview_message[:60], priority.upper())
+                    self._row_cache[title] = preview_text
                 except Exception as e:
                     self.logger.debug(f"Chat {i} error: {e}")
                     continue
@@ -354,55 +587,39 @@ class WhatsAppWatcher(BaseWatcher):
             return []
 
     def create_action_file(self, message) -> Path:
+        """Name the action file for message and queue its write on the writer thread; returns its path."""
+        # Get next file number
+        next_num = next(self._file_numbers)
+        filepath = self.needs_action / f"WHATSAPP_{next_num}.md"
+
+        # Marked processed now so the next scan doesn't queue it again; unmarked if the write fails
+        self.processed_messages.add(message_key(message['id']))
+        self._writer.submit(self._write_action_file, filepath, message)
+        return filepath
+
+    def _write_action_file(self, filepath: Path, message):
+        """Write the action file for message to filepath (runs on the writer thread)."""
         try:
-            # Get next file number
-            existing_files = list(self.needs_action.glob('WHATSAPP_*.md'))
-            next_num = len(existing_files) + 1
-            
-            filepath = self.needs_action / f"WHATSAPP_{next_num}.md"
-            
-            content = f"""---
-type: whatsapp_message
-source: whatsapp
-id: {message['id']}
-from: {message['from']}
-message: {message['message']}
-priority: {message['priority']}
-received: {datetime.now().isoformat()}
-status: pending
----
-
-# WhatsApp Message
-
-**From:** {message['from']}
-**Priority:** {message['priority'].upper()}
-**Received:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Message Content
-
-{message['message']}
-
-## Actions
-
-- [ ] Review and respond
-- [ ] Take required action
-
----
-*Generated by WhatsApp Watcher*
-"""
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            self.processed_messages.add(message['id'])
-            self._save_processed_ids()
+            # One timestamp for both fields; the display form is the ISO one with a space separator
+            received = datetime.now().isoformat(sep=' ', timespec='seconds')
+            content = ACTION_FILE_TEMPLATE.format(
+                id=message['id'],
+                sender=message['from'],
+                message=message['message'],
+                priority=message['priority'],
+                priority_label=message['priority'].upper(),
+                received=received.replace(' ', 'T'),
+                received_display=received,
+            )
+            filepath.write_text(content, encoding='utf-8')
+            self._new_message_ids.append(message['id'])
             # Beautiful console output for file creation
-            print(f"  ✅ Action File Created!")
-            print(f"  📄 File: {filepath.name}")
-            print(f"  📍 Location: Needs_Action/")
-            print(f"{'='*60}\n")
-            return filepath
+            self.banner.info('✅ Action File Created!\n📄 File: %s\n📍 Location: Needs_Action/', filepath.name)
         except Exception as e:
             self.logger.error(f'Error creating action file: {e}')
-            return Path('')
+            # Forget the message and its chat row so the next check picks the row up again
+            self.processed_messages.discard(message_key(message['id']))
+            self._row_cache.pop(message['from'], None)
 
 if __name__ == "__main__":
     import sys
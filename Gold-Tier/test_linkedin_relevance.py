@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+LinkedIn Relevance Tests
+Checks that keyword scoring counts plural and past-tense forms of each keyword
+"""
+
+import sys
+import functools
+from pathlib import Path
+
+import pytest
+
+# Add scripts folder to path
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+
+from linkedin_watcher import LinkedInWatcher
+
+# The scorers don't touch instance state
+business_relevance = functools.partial(LinkedInWatcher._analyze_business_relevance, None)
+connection_relevance = functools.partial(LinkedInWatcher._analyze_connection_relevance, None)
+
+@pytest.mark.parametrize('text, expected', [
+    ('Anna commented on your post', 0.2),
+    ('Anna mentioned you in a comment', 0.2),
+    ('Anna posted new job opportunities', 0.1 + 0.3),
+    ('3 new clients and 2 projects from leads', 0.9),
+    ('New connections in your network', 0.2),
+])
+def test_business_relevance_counts_inflected_forms(text, expected):
+    assert business_relevance(text) == pytest.approx(expected)
+
+def test_inflected_forms_count_once_per_keyword():
+    assert business_relevance('client clients') == pytest.approx(0.3)
+
+def test_connection_relevance_counts_plurals():
+    assert connection_relevance('Bob', 'Investors and Founders in Software', '') == pytest.approx(0.5)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+MCP Browser Server Tests
+Checks the browser server's call flow against a Page mock that has Playwright's real signatures
+"""
+
+import sys
+import json
+import asyncio
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import pytest
+
+# Add mcp folder to path
+sys.path.insert(0, str(Path(__file__).parent / 'mcp'))
+
+from playwright.sync_api import Page
+from mcp_browser_server import MCPBrowserServer, AsyncMCPBrowserServer
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Server with its config and log files in a temporary folder."""
+    monkeypatch.chdir(tmp_path)
+    return MCPBrowserServer(str(tmp_path / 'mcp_browser_config.json'))
+
+def fake_page():
+    """Page mock; calls with arguments Playwright doesn't accept raise TypeError."""
+    page = create_autospec(Page, instance=True)
+    page.context.storage_state.side_effect = lambda path=None: Path(path).write_text('{}')
+    return page
+
+def test_login_saves_storage_state(server, monkeypatch):
+    page = fake_page()
+    monkeypatch.setattr(server, '_acquire_page', lambda: page)
+
+    result = server.login('https://example.com/login', '#user', '#pass', '#submit', 'me', 'secret')
+
+    assert result == {"success": True, "action": "logged_in", "url": 'https://example.com/login'}
+    assert server.storage_state_path.exists()
+
+def test_released_page_keeps_only_saved_login_cookies(server):
+    login_cookie = {"name": "session", "value": "abc", "domain": "example.com", "path": "/"}
+    server.storage_state_path.write_text(json.dumps({"cookies": [login_cookie], "origins": []}))
+    page = fake_page()
+
+    server._release_page(page)
+
+    page.context.clear_cookies.assert_called_once_with()
+    page.context.add_cookies.assert_called_once_with([login_cookie])
+    assert server._page_pool.get_nowait() is page
+
+def test_async_server_has_only_the_async_lifecycle(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server = AsyncMCPBrowserServer(str(tmp_path / 'mcp_browser_config.json'))
+
+    assert not hasattr(server, '__exit__')
+    assert not hasattr(server, '_page_pool')
+
+    async def use():
+        async with server:
+            pass
+
+    asyncio.run(use())
@@ -4,30 +4,45 @@ Test script to verify Locator functionality
 
 from playwright.sync_api import sync_playwright
 
-def test_locator():
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+def test_locator(browser=None):
+    """
+    Check that a Locator can't be called like a function.
 
-        # Test locator operations
-        try:
-            # Test basic locator
-            locator = page.locator('body')
-            print("Locator created successfully")
-
-            # Test calling locator (should fail)
+    Args:
+        browser: Already-launched browser to reuse; a fresh context is opened in it.
+            When omitted, a browser is launched just for this test.
+    """
+    if browser is None:
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
             try:
-                result = locator()  # This should raise TypeError
-                print("Locator called successfully (this should not happen)")
-            except TypeError as e:
-                print(f"Expected TypeError when calling locator: {e}")
-                print("Locator test passed!")
-            except Exception as e:
-                print(f"Unexpected error: {e}")
+                test_locator(browser)
+            finally:
+                browser.close()
+        return
+
+    context = browser.new_context()
+    page = context.new_page()
+
+    # Test locator operations
+    try:
+        # Test basic locator
+        locator = page.locator('body')
+        print("Locator created successfully")
+
+        # Test calling locator (should fail)
+        try:
+            result = locator()  # This should raise TypeError
+            print("Locator called successfully (this should not happen)")
+        except TypeError as e:
+            print(f"Expected TypeError when calling locator: {e}")
+            print("Locator test passed!")
         except Exception as e:
-            print(f"Error creating locator: {e}")
-        finally:
-            browser.close()
+            print(f"Unexpected error: {e}")
+    except Exception as e:
+        print(f"Error creating locator: {e}")
+    finally:
+        context.close()
 
 if __name__ == "__main__":
     test_locator()
\ No newline at end of file
@@ -4,35 +4,64 @@ Simple test to check if Playwright works
 from playwright.sync_api import sync_playwright
 import os
 
-print("Testing Playwright...")
-
-try:
-    with sync_playwright() as p:
-        # Try to use system Chrome
-        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-        
-        if not os.path.exists(chrome_path):
-            print(f"Chrome not found at {chrome_path}")
-            chrome_path = None
-        
-        print("Launching browser...")
-        browser = p.chromium.launch(
-            executable_path=chrome_path,
-            headless=False,
-            args=['--no-sandbox', '--disable-gpu']
-        )
-        print("Browser launched!")
-        
-        page = browser.new_page()
+def launch_browser(p):
+    """
+    Launch the system Chrome (or bundled Chromium) used by the WhatsApp checks.
+
+    Args:
+        p: Running sync_playwright instance
+    """
+    # Try to use system Chrome
+    chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
+
+    if not os.path.exists(chrome_path):
+        print(f"Chrome not found at {chrome_path}")
+        chrome_path = None
+
+    print("Launching browser...")
+    browser = p.chromium.launch(
+        executable_path=chrome_path,
+        headless=False,
+        args=['--no-sandbox', '--disable-gpu']
+    )
+    print("Browser launched!")
+    return browser
+
+def check_whatsapp(browser):
+    """
+    Open WhatsApp Web in a fresh context of an already-launched browser.
+
+    Args:
+        browser: Browser from launch_browser, shared with the other checks
+    """
+    context = browser.new_context()
+    try:
+        page = context.new_page()
         print("Opening WhatsApp Web...")
         page.goto('https://web.whatsapp.com')
         print("Done! Check the browser window.")
-        
+
         input("Press Enter to close browser...")
-        browser.close()
-        print("Browser closed")
-        
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
+    finally:
+        context.close()
+
+if __name__ == "__main__":
+    from test_locator import test_locator
+
+    print("Testing Playwright...")
+
+    try:
+        # One browser launch for every check; each gets its own context
+        with sync_playwright() as p:
+            browser = launch_browser(p)
+            try:
+                test_locator(browser)
+                check_whatsapp(browser)
+            finally:
+                browser.close()
+            print("Browser closed")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()